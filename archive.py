@@ -0,0 +1,191 @@
+"""Validate move log archives using all cores.
+
+Games are sent by chunks to a pool of processes and results are given back
+in archive order. When a worker dies, games of the chunks it may have been
+running are replayed one by one in a separate process, so that only the
+game making it crash is reported as such.
+
+Usage:
+    python archive.py archive/*.txt --processes 8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from board import BitBoard
+from replay import GameResult, iter_games, replay
+from utils.instrumentation import normalize_reason
+
+
+CRASHED = "Worker crashed while replaying game"
+
+_board = None   # BitBoard reused by a worker process
+
+
+def _replay_chunk(games):
+    """Replay a chunk of games in a worker process."""
+    global _board
+    if _board is None:
+        _board = BitBoard()
+    return list(replay(games, _board))
+
+
+def chunked(iterable, size):
+    """Yield lists of size items from iterable."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class ArchiveStats(object):
+    """Aggregated statistics of replayed games."""
+
+    def __init__(self):
+        self.games = 0
+        self.plies = 0
+        self.invalid = 0
+        self.crashed = 0
+        self.errors = Counter()     # Number of invalid games per reason
+
+    def add(self, result):
+        """Account for a GameResult."""
+        self.games += 1
+        self.plies += result.plies
+        if result.error == CRASHED:
+            self.crashed += 1
+        elif result.error is not None:
+            self.invalid += 1
+            self.errors[normalize_reason(result.error)] += 1
+
+    def as_dict(self):
+        return {
+            'games': self.games,
+            'plies': self.plies,
+            'invalid': self.invalid,
+            'crashed': self.crashed,
+            'errors': dict(self.errors),
+        }
+
+
+def validate(games, processes=None, chunk_size=64):
+    """Yield GameResult of games, in order, replayed by a process pool.
+
+    Args:
+        games (iterable): (source, index, moves) games, see iter_games
+        processes (int): number of worker processes, one per core if None
+        chunk_size (int): number of games sent at once to a worker
+    """
+    processes = processes or os.cpu_count() or 1
+    chunks = chunked(games, chunk_size)
+    pool = ProcessPoolExecutor(processes)
+    quarantine = None   # Single worker pool for suspect games
+    pending = deque()   # [chunk, future] in archive order, future is None
+                        # for suspect chunks
+
+    def restart(pool):
+        """Replace broken pool, any unfinished chunk becomes suspect."""
+        for entry in pending:
+            future = entry[1]
+            if future is None or future.cancelled():
+                entry[1] = None
+            elif not future.done() or future.exception() is not None:
+                entry[1] = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        return ProcessPoolExecutor(processes)
+
+    try:
+        while True:
+            # Keep workers busy
+            while len(pending) < 2 * processes:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                try:
+                    future = pool.submit(_replay_chunk, chunk)
+                except BrokenProcessPool:
+                    pool = restart(pool)
+                    future = pool.submit(_replay_chunk, chunk)
+                pending.append([chunk, future])
+            if not pending:
+                break
+
+            chunk, future = pending[0]
+            if future is not None:
+                try:
+                    results = future.result()
+                except BrokenProcessPool:
+                    pool = restart(pool)
+                    continue
+            else:
+                results = []
+                for game in chunk:
+                    if quarantine is None:
+                        quarantine = ProcessPoolExecutor(1)
+                    try:
+                        results.extend(
+                            quarantine.submit(_replay_chunk, [game]).result()
+                        )
+                    except BrokenProcessPool:
+                        quarantine.shutdown(wait=False)
+                        quarantine = None
+                        source, index, _ = game
+                        results.append(
+                            GameResult(source, index, 0, None, CRASHED)
+                        )
+            pending.popleft()
+            yield from results
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        if quarantine is not None:
+            quarantine.shutdown(wait=False)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("paths", nargs="+", help="move log files")
+    parser.add_argument("-p", "--processes", type=int, default=None)
+    parser.add_argument("-c", "--chunk-size", type=int, default=64)
+    parser.add_argument(
+        "-q", "--quiet", action="store_true",
+        help="only print statistics",
+    )
+    args = parser.parse_args(args)
+
+    stats = ArchiveStats()
+    start = time.perf_counter()
+    results = validate(
+        iter_games(args.paths),
+        processes=args.processes,
+        chunk_size=args.chunk_size,
+    )
+    for result in results:
+        stats.add(result)
+        if result.error is not None and not args.quiet:
+            print(
+                "%s [game %s] move %s '%s': %s"
+                % (
+                    result.source, result.index, result.plies + 1,
+                    result.move, result.error,
+                )
+            )
+    elapsed = time.perf_counter() - start
+
+    summary = stats.as_dict()
+    summary['time'] = round(elapsed, 3)
+    summary['games_per_s'] = round(stats.games / elapsed if elapsed else 0, 1)
+    print(json.dumps(summary, indent=2))
+    return 1 if stats.invalid or stats.crashed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1 +1,6 @@
-from .board import Board
+from .board import Board, Verdict, start_placement
+from .encoding import EncodingError
+from .bitboard import BitBoard
+from .pool import BoardPool
+from .store import GameStore
+from . import instrumentation
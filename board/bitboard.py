@@ -0,0 +1,227 @@
+from gameplay import InvalidMove
+from parameters import BLACK, WHITE, TOP_COLOR
+from pieces import King, Pawn
+from utils import Position
+
+from .board import Board
+
+
+SYMBOLS = "PNBRQK"
+
+_path_masks = {}
+
+
+def path_mask(square, dx, dy, steps):
+    """Return mask of squares met when stepping from square (excluded).
+
+    Args:
+        square (int): square index (0..63) of path origin
+        dx, dy (int): step of path
+        steps (int): number of squares in path
+
+    Returns:
+        (int): 64 bit mask, squares out of board are ignored
+    """
+    key = (square, dx, dy, steps)
+    mask = _path_masks.get(key)
+    if mask is None:
+        mask = 0
+        x, y = divmod(square, 8)
+        for _ in range(steps):
+            x, y = x + dx, y + dy
+            if 0 <= x < 8 and 0 <= y < 8:
+                mask |= 1 << (x * 8 + y)
+        _path_masks[key] = mask
+    return mask
+
+
+def step_masks(steps):
+    """Return, by square, mask of squares reached with one of steps."""
+    return [
+        sum(path_mask(square, dx, dy, 1) for dx, dy in steps)
+        for square in range(64)
+    ]
+
+
+def squares_of(mask):
+    """Return list of square indexes set in mask."""
+    squares = []
+    while mask:
+        low = mask & -mask
+        squares.append(low.bit_length() - 1)
+        mask ^= low
+    return squares
+
+
+ORTHOGONAL = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+DIAGONAL = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+KNIGHT_ATTACKS = step_masks([
+    (2, 1), (2, -1), (-2, 1), (-2, -1), (1, 2), (1, -2), (-1, 2), (-1, -2),
+])
+KING_ATTACKS = step_masks(ORTHOGONAL + DIAGONAL)
+PAWN_STEP = {
+    color: 1 if color is TOP_COLOR else -1 for color in (BLACK, WHITE)
+}
+PAWN_ATTACKS = {
+    color: step_masks([(dx, 1), (dx, -1)]) for color, dx in PAWN_STEP.items()
+}
+
+# Rays of sliders: by direction then square, mask of squares up to edge
+DIRECTIONS = ORTHOGONAL + DIAGONAL
+RAYS = [
+    [path_mask(square, dx, dy, 7) for square in range(64)]
+    for dx, dy in DIRECTIONS
+]
+FORWARD = [dx * 8 + dy > 0 for dx, dy in DIRECTIONS]
+SLIDER_DIRECTIONS = {"R": range(0, 4), "B": range(4, 8), "Q": range(8)}
+STEPS = {"N": KNIGHT_ATTACKS, "K": KING_ATTACKS}
+
+
+class BitBoard(Board):
+    """Board keeping per-color, per-piece-type 64 bit occupancy masks.
+
+    Bit n of a mask stands for square n, that is Position(n // 8, n % 8).
+    Only active pieces are represented in masks. Attacks and legal moves
+    are computed from masks rather than by visiting squares.
+    """
+
+    def reset(self, placement=None, playing_color=WHITE):
+        self._masks = {
+            BLACK: dict.fromkeys(SYMBOLS, 0),
+            WHITE: dict.fromkeys(SYMBOLS, 0),
+        }
+        self._occupancy = {BLACK: 0, WHITE: 0}
+        super().reset(placement, playing_color)
+
+    def _add_piece(self, piece):
+        super()._add_piece(piece)
+        self._toggle(piece, piece.pos.square)
+
+    def _toggle(self, piece, square):
+        """Flip square bit of piece in masks."""
+        bit = 1 << square
+        self._masks[piece.color][piece.symbol()] ^= bit
+        self._occupancy[piece.color] ^= bit
+
+    # ----------------------------------------------------------------------- #
+    # Masks
+
+    def mask(self, color, symbol):
+        """Return occupancy mask of a piece type for given color."""
+        return self._masks[color][symbol]
+
+    def occupancy(self, color=None):
+        """Return occupancy mask of color, of both colors if None."""
+        if color is None:
+            return self._occupancy[BLACK] | self._occupancy[WHITE]
+        return self._occupancy[color]
+
+    def attack_mask(self, piece):
+        """Return mask of squares an active piece attacks."""
+        symbol = piece.symbol()
+        square = piece.pos.square
+        if symbol == "P":
+            return PAWN_ATTACKS[piece.color][square]
+        steps = STEPS.get(symbol)
+        if steps is not None:
+            return steps[square]
+        occupancy = self._occupancy[BLACK] | self._occupancy[WHITE]
+        attacks = 0
+        for direction in SLIDER_DIRECTIONS[symbol]:
+            rays = RAYS[direction]
+            ray = rays[square]
+            blockers = ray & occupancy
+            if blockers:
+                if FORWARD[direction]:
+                    blocker = (blockers & -blockers).bit_length() - 1
+                else:
+                    blocker = blockers.bit_length() - 1
+                ray ^= rays[blocker]    # Squares beyond blocker
+            attacks |= ray
+        return attacks
+
+    def attacked_squares(self, piece):
+        return tuple(squares_of(self.attack_mask(piece)))
+
+    def first_blocker(self, origin, direction, steps):
+        blockers = self.occupancy() & path_mask(
+            origin.square, direction.x, direction.y, steps
+        )
+        if not blockers:
+            return None
+        if direction.x * 8 + direction.y > 0:
+            square = (blockers & -blockers).bit_length() - 1
+        else:
+            square = blockers.bit_length() - 1
+        return Position.from_square(square)
+
+    # ----------------------------------------------------------------------- #
+    # Playing
+
+    def legal_moves(self):
+        color = self._playing_color
+        own = self._occupancy[color]
+        enemy = self._occupancy[1 - color]
+        moves = []
+        for piece in self._pieces[color]:
+            if not piece.is_alife():
+                continue
+            if isinstance(piece, Pawn):
+                targets = self._pawn_targets(piece, own | enemy, enemy)
+            else:
+                targets = self.attack_mask(piece) & ~own
+            origin = piece.pos
+            for square in squares_of(targets):
+                move = piece.get_move(Position.from_square(square) - origin)
+                if not self.exposes_king(move):
+                    moves.append(move)
+            if isinstance(piece, King) and not piece.has_moved():
+                moves.extend(self._castlings(piece))
+        return moves
+
+    def _pawn_targets(self, pawn, occupancy, enemy):
+        """Return mask of squares pawn can move to."""
+        square = pawn.pos.square
+        targets = PAWN_ATTACKS[pawn.color][square] & enemy
+        step = PAWN_STEP[pawn.color] * 8
+        for _ in range(1 if pawn.has_moved() else 2):
+            square += step
+            if not 0 <= square < 64 or occupancy >> square & 1:
+                break
+            targets |= 1 << square
+        return targets
+
+    def _castlings(self, king):
+        """Return castling moves king can do."""
+        moves = []
+        for spec in king.move_table(king.color)[0]:
+            if spec.kind.castling:
+                move = spec.bind(king)
+                try:
+                    move.check(self)
+                except InvalidMove:
+                    continue
+                if not self.exposes_king(move):
+                    moves.append(move)
+        return moves
+
+    # ----------------------------------------------------------------------- #
+    # Reversible actions
+
+    def _move_piece(self, position, piece):
+        cpiece = super()._move_piece(position, piece)
+        if piece.is_alife():
+            self._toggle(piece, piece.pos.square)
+            self._toggle(piece, position.square)
+        return cpiece
+
+    def _kill(self, piece):
+        self._toggle(piece, piece.pos.square)
+        super()._kill(piece)
+
+    def _unkill(self, piece):
+        self._toggle(piece, piece.pos.square)
+        super()._unkill(piece)
+        # Square was seen empty by sliders when killer moved back
+        self._update_attacks(piece, piece.pos.square)
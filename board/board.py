@@ -1,4 +1,7 @@
-from gameplay import InvalidMove
+from array import array
+from collections import namedtuple
+
+from gameplay import InvalidMove, encode_move
 from parameters import BLACK, WHITE, TOP_COLOR
 from pieces import (
     Bishop,
@@ -9,31 +12,52 @@ from pieces import (
     Rook,
 )
 from utils import Position
+from utils.instrumentation import REGISTRY
+
+from .encoding import (
+    decode_fen,
+    decode_packed,
+    decode_snapshot,
+    encode_fen,
+    encode_packed,
+    encode_snapshot,
+)
+from .render import BOARD_FORMAT, Renderer
+from .scores import SQUARE_SCORES
+from .zobrist import CASTLING_KEYS, PIECE_KEYS, SIDE_KEY
 
 
-BOARD_FORMAT = (
-    """
-      a   b   c   d   e   f   g   h
-    +---+---+---+---+---+---+---+---+
-  8 |0 0|0 1|0 2|0 3|0 4|0 5|0 6|0 7| 8
-    +---+---+---+---+---+---+---+---+
-  7 |1 0|1 1|1 2|1 3|1 4|1 5|1 6|1 7| 7
-    +---+---+---+---+---+---+---+---+
-  6 |2 0|2 1|2 2|2 3|2 4|2 5|2 6|2 7| 6
-    +---+---+---+---+---+---+---+---+
-  5 |3 0|3 1|3 2|3 3|3 4|3 5|3 6|3 7| 5
-    +---+---+---+---+---+---+---+---+
-  4 |4 0|4 1|4 2|4 3|4 4|4 5|4 6|4 7| 4
-    +---+---+---+---+---+---+---+---+
-  3 |5 0|5 1|5 2|5 3|5 4|5 5|5 6|5 7| 3
-    +---+---+---+---+---+---+---+---+
-  2 |6 0|6 1|6 2|6 3|6 4|6 5|6 6|6 7| 2
-    +---+---+---+---+---+---+---+---+
-  1 |7 0|7 1|7 2|7 3|7 4|7 5|7 6|7 7| 1
-    +---+---+---+---+---+---+---+---+
-      a   b   c   d   e   f   g   h
+def start_placement():
+    """Return placement of start position.
+
+    A placement is a list of (piece class, color, x, y, moved) tuples.
     """
-)
+    placement = []
+    for color in [BLACK, WHITE]:
+        for pawn_n in range(8):
+            x = 1 if color is TOP_COLOR else 6
+            y = pawn_n
+            placement.append((Pawn, color, x, y, False))
+
+        lign = 0 if color is TOP_COLOR else 7
+        placement.append((Bishop, color, lign, 2, False))
+        placement.append((Bishop, color, lign, 5, False))
+        placement.append((Knight, color, lign, 1, False))
+        placement.append((Knight, color, lign, 6, False))
+        placement.append((Rook, color, lign, 0, False))
+        placement.append((Rook, color, lign, 7, False))
+        if TOP_COLOR is BLACK:
+            placement.append((Queen, color, lign, 3, False))
+            placement.append((King, color, lign, 4, False))
+        else:
+            placement.append((King, color, lign, 3, False))
+            placement.append((Queen, color, lign, 4, False))
+    return placement
+
+
+START_PLACEMENT = start_placement()
+
+RENDERER = Renderer()   # Shared by boards, renders are cached per position
 
 
 class PList(list):
@@ -53,9 +77,21 @@ class BoardError(Exception):
     pass
 
 
+Verdict = namedtuple("Verdict", ["valid", "reason"])
+
+
 class Board(object):
 
-    def __init__(self):
+    STACK_SIZE = 64     # Make / unmake records allocated at creation
+
+    def __init__(self, placement=None, playing_color=WHITE):
+        """Create a board.
+
+        Args:
+            placement (list): pieces to set, see start_placement,
+                default is start position
+            playing_color (int): color playing first
+        """
         self._shape = (8, 8)
         self._board = []
         for x in range(8):
@@ -64,42 +100,87 @@ class Board(object):
                 self._board[x].append(None)
 
         self._pieces = None
+        self._kings = None
+        self._rooks = None
         self._playing_color = None
         self._action_batchs = []
-        self.init()
+        self._ply_offset = 0
+        self._castling = 0
+        self._key = 0
+        self._scores = None
+        self._stack = [[None] * 7 for _ in range(self.STACK_SIZE)]
+        self._sp = 0                # Number of records in use in _stack
+        self._attacks = None
+        self._attackers = None
+        self._piece_attacks = None
+        self.reset(placement, playing_color)
 
     def _add_piece(self, piece):
         """Add piece to board, no question asked."""
         self._board[piece.x][piece.y] = piece
         self._pieces[piece.color].append(piece)
+        if isinstance(piece, King):
+            self._kings[piece.color] = piece
+        elif isinstance(piece, Rook):
+            self._rooks[piece.color].append(piece)
 
     def init(self):
         """Initialize board pieces."""
+        self.reset()
+
+    def reset(self, placement=None, playing_color=WHITE):
+        """Reset board in place, reusing its pieces.
+
+        Args:
+            placement (list): pieces to set, see start_placement,
+                default is start position
+            playing_color (int): color to play
+        """
+        if placement is None:
+            placement = START_PLACEMENT
+
+        # Pieces available for reuse, by class and color
+        stock = {}
+        if self._pieces is not None:
+            for pieces in self._pieces.values():
+                for piece in pieces:
+                    key = (piece.__class__, piece.color)
+                    stock.setdefault(key, []).append(piece)
+
+        for row in self._board:
+            for y in range(8):
+                row[y] = None
         self._pieces = {
             BLACK: PList([]),
             WHITE: PList([]),
         }
-        self._playing_color = WHITE
-        for color in [BLACK, WHITE]:
-            for pawn_n in range(8):
-                x = 1 if color is TOP_COLOR else 6
-                y = pawn_n
-                pawn = Pawn(x, y, color)
-                self._add_piece(pawn)
-
-            lign = 0 if color is TOP_COLOR else 7
-            self._add_piece(Bishop(lign, 2, color))
-            self._add_piece(Bishop(lign, 5, color))
-            self._add_piece(Knight(lign, 1, color))
-            self._add_piece(Knight(lign, 6, color))
-            self._add_piece(Rook(lign, 0, color))
-            self._add_piece(Rook(lign, 7, color))
-            if TOP_COLOR is BLACK:
-                self._add_piece(Queen(lign, 3, color))
-                self._add_piece(King(lign, 4, color))
+        self._kings = {}
+        self._rooks = {BLACK: [], WHITE: []}
+        self._playing_color = playing_color
+        self._action_batchs = []
+        self._ply_offset = 0
+        self._sp = 0
+        for piece_class, color, x, y, moved in placement:
+            available = stock.get((piece_class, color))
+            if available:
+                piece = available.pop()
+                piece.reset(x, y, moved)
             else:
-                self._add_piece(King(lign, 3, color))
-                self._add_piece(Queen(lign, 4, color))
+                piece = piece_class(x, y, color, moved)
+            self._add_piece(piece)
+        self._castling = self.castling_rights()
+        self._key = self.compute_key()
+        self._scores = {
+            BLACK: self.compute_score(BLACK),
+            WHITE: self.compute_score(WHITE),
+        }
+
+        self._attacks = {BLACK: [0] * 64, WHITE: [0] * 64}
+        self._attackers = [set() for _ in range(64)]
+        self._piece_attacks = {}
+        for pieces in self._pieces.values():
+            for piece in pieces:
+                self._set_attacks(piece)
 
     # ----------------------------------------------------------------------- #
     # Properties & g/s-etters
@@ -113,14 +194,187 @@ class Board(object):
             return "White"
         return None
 
+    @property
+    def playing_color(self):
+        """Return current player color (BLACK or WHITE)."""
+        return self._playing_color
+
+    def pieces(self, color):
+        """Return pieces of color, killed ones included."""
+        return self._pieces[color]
+
+    @property
+    def ply(self):
+        """Return number of half moves played."""
+        return self._ply_offset + len(self._action_batchs) + self._sp
+
     def change_player(self):
         """Change player"""
         self._playing_color = BLACK if self._playing_color is WHITE else WHITE
+        self._key ^= SIDE_KEY
+
+    @property
+    def key(self):
+        """Return Zobrist key of position."""
+        return self._key
+
+    def compute_key(self):
+        """Compute Zobrist key of position from scratch."""
+        key = CASTLING_KEYS[self.castling_rights()]
+        if self._playing_color is BLACK:
+            key ^= SIDE_KEY
+        for color, pieces in self._pieces.items():
+            for piece in pieces:
+                if piece.is_alife():
+                    key ^= PIECE_KEYS[color][piece.symbol()][piece.pos.square]
+        return key
+
+    def score(self, color):
+        """Return material and piece-square score of color."""
+        return self._scores[color]
+
+    def compute_score(self, color):
+        """Compute score of color from scratch."""
+        table = SQUARE_SCORES[color]
+        return sum(
+            table[piece.symbol()][piece.pos.square]
+            for piece in self._pieces[color]
+            if piece.is_alife()
+        )
+
+    def evaluate(self):
+        """Return static evaluation from current player point of view."""
+        color = self._playing_color
+        return self._scores[color] - self._scores[1 - color]
+
+    def castling_rights(self):
+        """Return castling rights as a 4 bits mask.
+
+        Bit (2 * color + side) is set when king of color and its rook on
+        side (0 for column a, 1 for column h) have not moved yet.
+        """
+        rights = 0
+        for color, king in self._kings.items():
+            if king.has_moved() or not king.is_alife():
+                continue
+            for rook in self._rooks[color]:
+                if (
+                    rook.is_alife()
+                    and not rook.has_moved()
+                    and rook.x == king.x
+                    and rook.y in (0, 7)
+                ):
+                    rights |= 1 << (2 * color + (rook.y == 7))
+        return rights
+
+    def _update_castling(self):
+        """Update castling rights and key after a king or rook change."""
+        castling = self.castling_rights()
+        self._key ^= CASTLING_KEYS[self._castling] ^ CASTLING_KEYS[castling]
+        self._castling = castling
+
+    def _move_score(self, piece, origin, destination):
+        """Update score of piece color after it moved."""
+        table = SQUARE_SCORES[piece.color][piece.symbol()]
+        self._scores[piece.color] += (
+            table[destination.square] - table[origin.square]
+        )
+
+    def _toggle_key(self, piece, position):
+        """Xor piece at position in Zobrist key."""
+        self._key ^= PIECE_KEYS[piece.color][piece.symbol()][position.square]
+
+    # ----------------------------------------------------------------------- #
+    # Attacks
+
+    def is_attacked(self, position, color):
+        """Return whether a piece of color attacks position."""
+        return self._attacks[color][position.square] > 0
+
+    def attackers(self, position):
+        """Return set of pieces attacking position."""
+        return self._attackers[position.square]
+
+    def is_in_check(self, color=None):
+        """Return whether king of color (current player if None) is attacked.
+        """
+        if color is None:
+            color = self._playing_color
+        king = self._kings.get(color)
+        if king is None or not king.is_alife():
+            return False
+        return self._attacks[1 - color][king.pos.square] > 0
+
+    def exposes_king(self, move):
+        """Return whether move would leave king of its piece in check."""
+        piece = move.piece
+        color = piece.color
+        # Only a king move, a move out of a slider line or a move while in
+        # check can end up in check
+        if piece is not self._kings.get(color) and not self.is_in_check(color):
+            for attacker in self._attackers[piece.pos.square]:
+                if attacker.slider and attacker.color is not color:
+                    break
+            else:
+                return False
+        self.make(move)
+        exposed = self.is_in_check(color)
+        self.unmake()
+        return exposed
+
+    def attacked_squares(self, piece):
+        """Return tuple of square indexes an active piece attacks."""
+        return piece.attacked_squares(self)
+
+    def _set_attacks(self, piece):
+        """Recompute squares attacked by piece."""
+        squares = self.attacked_squares(piece) if piece.is_alife() else ()
+        former = self._piece_attacks.get(piece, ())
+        if squares == former:
+            return
+        counts = self._attacks[piece.color]
+        attackers = self._attackers
+        for square in former:
+            counts[square] -= 1
+            attackers[square].discard(piece)
+        for square in squares:
+            counts[square] += 1
+            attackers[square].add(piece)
+        self._piece_attacks[piece] = squares
+
+    def _update_attacks(self, piece, *squares):
+        """Recompute attacks after piece moved, squares changing occupancy.
+
+        Beside piece, only sliders attacking those squares are affected.
+        """
+        pieces = {piece}
+        for square in squares:
+            for attacker in self._attackers[square]:
+                if attacker.slider:
+                    pieces.add(attacker)
+        for attacker in pieces:
+            self._set_attacks(attacker)
+
+    # ----------------------------------------------------------------------- #
+    # Squares
 
     def get(self, position):
         """Return piece at position."""
         return self._board[position.x][position.y]
 
+    def first_blocker(self, origin, direction, steps):
+        """Return first occupied position along a path, None if path is free.
+
+        Args:
+            origin (Position): start of path (excluded)
+            direction (Vector): step of path
+            steps (int): number of squares to look at
+        """
+        for int_pos in direction.iter(origin, steps):
+            if self.get(int_pos):
+                return int_pos
+        return None
+
     def _move_piece(self, position, piece):
         """Move piece on position (does not set piece position).
 
@@ -141,23 +395,80 @@ class Board(object):
 
     def move(self, pos, npos):
         """Move piece at pos to npos if possible."""
-        pos = Position(*pos)
-        npos = Position(*npos)
+        move = self._get_move(Position.of(*pos), Position.of(*npos))
+        move.check(self)
+        if self.exposes_king(move):
+            raise InvalidMove("Can't leave your king in check")
+        self.play(move)
 
+    def _get_move(self, pos, npos):
+        """Return move of piece at pos to npos, without checking it."""
         # Check square contains piece of right color
         piece = self.get(pos)
         if piece is None:
             raise InvalidMove("No piece on that position")
         elif piece.color is not self._playing_color:
             raise InvalidMove("You must move piece of your color")
+        return piece.get_move(npos - pos)
 
-        # Check whether move is possible
-        move = piece.get_move(npos - pos)
-        move.check(self)
+    def validate_moves(self, pairs):
+        """Tell whether each move could be played, leaving board as is.
+
+        Each move is checked as move would, without being played. Repeated
+        pairs are only checked once.
+
+        Args:
+            pairs (list): (pos, npos) pairs, as given to move
+
+        Returns:
+            (list[Verdict]): verdict of each move
+        """
+        known = {}
+        verdicts = []
+        for pos, npos in pairs:
+            pair = (tuple(pos), tuple(npos))
+            verdict = known.get(pair)
+            if verdict is None:
+                verdict = known[pair] = self._verdict(*pair)
+            verdicts.append(verdict)
+        return verdicts
+
+    def _verdict(self, pos, npos):
+        """Return Verdict of moving piece at pos to npos."""
+        for x, y in (pos, npos):
+            if not (0 <= x < 8 and 0 <= y < 8):
+                return Verdict(False, "Position out of board")
+        try:
+            move = self._get_move(Position.of(*pos), Position.of(*npos))
+            move.check(self)
+        except InvalidMove as e:
+            return Verdict(False, str(e))
+        if self.exposes_king(move):
+            return Verdict(False, "Can't leave your king in check")
+        return Verdict(True, None)
+
+    def play(self, move):
+        """Play a move of current player with no checking.
+
+        Args:
+            move (gameplay.moves.Move): a move, as returned by legal_moves
+        """
         action_batch = move.create_batch(self)
         self._apply(action_batch)
         self.change_player()
 
+    def legal_moves(self):
+        """Return all moves current player can play.
+
+        Returns:
+            (list[gameplay.moves.Move]): moves to give to play
+        """
+        moves = []
+        for piece in self._pieces[self._playing_color]:
+            if piece.is_alife():
+                moves.extend(piece.legal_moves(self))
+        return moves
+
     # ----------------------------------------------------------------------- #
     # Reversible actions
 
@@ -180,22 +491,37 @@ class Board(object):
         self._unapply()
         self.change_player()
 
+    def move_log(self):
+        """Return moves played since board was set, oldest first.
+
+        Returns:
+            (array): moves encoded with gameplay.encode_move, that is
+                origin and destination squares of each moving piece
+        """
+        log = array('H')
+        for action_batch in self._action_batchs:
+            for action in action_batch:
+                if action.name == "move":
+                    log.append(encode_move(
+                        action.ukwargs['origin'], action.ukwargs['dest']
+                    ))
+                    break
+        return log
+
     def _rev_kill(self, piece):
         """Reversible kill."""
-        piece.kill()
+        self._kill(piece)
         return {'piece': piece}
 
     def _undo_kill(self, piece):
         """Undo kill."""
-        piece.unkill()
+        self._unkill(piece)
 
     def _rev_move(self, piece, destination):
         """Reversible move."""
         if not piece.is_alife():
             raise BoardError("Can't move an unactive piece")
-        or_pos = piece.pos.copy()
-        opiece = self._move_piece(destination, piece)  # former piece
-        piece.set(destination)
+        or_pos, opiece = self._relocate(piece, destination)
         return {
             'origin': or_pos,
             'dest': destination,
@@ -205,25 +531,179 @@ class Board(object):
 
     def _undo_move(self, origin, dest, piece, opiece):
         """Undo move."""
+        self._unrelocate(piece, origin, dest, opiece)
+
+    def _kill(self, piece):
+        """Kill piece, keeping board state up to date."""
+        piece.kill()
+        self._toggle_key(piece, piece.pos)
+        self._scores[piece.color] -= (
+            SQUARE_SCORES[piece.color][piece.symbol()][piece.pos.square]
+        )
+        if isinstance(piece, Rook):
+            self._update_castling()
+        self._set_attacks(piece)
+
+    def _unkill(self, piece):
+        """Revive piece, keeping board state up to date."""
+        piece.unkill()
+        self._toggle_key(piece, piece.pos)
+        self._scores[piece.color] += (
+            SQUARE_SCORES[piece.color][piece.symbol()][piece.pos.square]
+        )
+        if isinstance(piece, Rook):
+            self._update_castling()
+        self._set_attacks(piece)
+
+    def _relocate(self, piece, destination):
+        """Move piece to destination, keeping board state up to date.
+
+        Returns:
+            (Position, Piece): origin of piece, overwritten piece
+        """
+        or_pos = piece.pos
+        opiece = self._move_piece(destination, piece)  # former piece
+        piece.set(destination)
+        self._toggle_key(piece, or_pos)
+        self._toggle_key(piece, destination)
+        self._move_score(piece, or_pos, destination)
+        if isinstance(piece, (King, Rook)):
+            self._update_castling()
+        self._update_attacks(piece, or_pos.square, destination.square)
+        return or_pos, opiece
+
+    def _unrelocate(self, piece, origin, dest, opiece):
+        """Move piece back to origin, putting back overwritten piece."""
         self._move_piece(origin, piece)
         if opiece:
             self._move_piece(dest, opiece)
         piece.unset(origin)
+        self._toggle_key(piece, dest)
+        self._toggle_key(piece, origin)
+        self._move_score(piece, dest, origin)
+        if isinstance(piece, (King, Rook)):
+            self._update_castling()
+        self._update_attacks(piece, origin.square, dest.square)
+
+    # ----------------------------------------------------------------------- #
+    # Make / unmake
+
+    def make(self, move):
+        """Play a move of current player with no checking, lean version.
+
+        Same as play, but undo information goes to a preallocated stack of
+        fixed layout records instead of an action batch. Moves made this
+        way must be undone with unmake, before any call to undo.
+
+        Args:
+            move (gameplay.moves.Move): a move, as returned by legal_moves
+        """
+        if self._sp == len(self._stack):
+            self._stack.append([None] * 7)
+        record = self._stack[self._sp]
+        self._sp += 1
+
+        piece = move.piece
+        destination = move.get_destination()
+        record[0] = piece
+        record[2] = destination
+        if move.castling:
+            rook = self.get(move.corner)
+            rook_destination = destination - move.direction
+            record[1], _ = self._relocate(piece, destination)
+            record[3] = None
+            record[4] = rook
+            record[5], _ = self._relocate(rook, rook_destination)
+            record[6] = rook_destination
+        else:
+            victim = self._board[destination.x][destination.y]
+            if victim is not None:
+                self._kill(victim)
+            record[1], record[3] = self._relocate(piece, destination)
+            record[4] = None
+        self.change_player()
+
+    def unmake(self):
+        """Undo last move made with make."""
+        self._sp -= 1
+        piece, origin, destination, victim, rook, rook_origin, rook_dest = (
+            self._stack[self._sp]
+        )
+        self.change_player()
+        if rook is not None:
+            self._unrelocate(rook, rook_origin, rook_dest, None)
+            self._unrelocate(piece, origin, destination, None)
+        else:
+            self._unrelocate(piece, origin, destination, victim)
+            if victim is not None:
+                self._unkill(victim)
+
+    # ----------------------------------------------------------------------- #
+    # Snapshots
+
+    def snapshot(self):
+        """Return position as compact immutable bytes.
+
+        Snapshot holds square contents, player, castling rights and number
+        of half moves played, but no history: boards built from it can't
+        undo past it.
+        """
+        return encode_snapshot(self)
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Create a board from a snapshot."""
+        placement, playing_color, ply = decode_snapshot(snapshot)
+        board = cls(placement, playing_color)
+        board._ply_offset = ply
+        return board
+
+    def load_snapshot(self, snapshot):
+        """Reset board in place to a snapshot."""
+        placement, playing_color, ply = decode_snapshot(snapshot)
+        self.reset(placement, playing_color)
+        self._ply_offset = ply
+
+    def fen(self):
+        """Return FEN of position."""
+        return encode_fen(self)
+
+    @classmethod
+    def from_fen(cls, fen):
+        """Create a board from a FEN."""
+        placement, playing_color, ply = decode_fen(fen)
+        board = cls(placement, playing_color)
+        board._ply_offset = ply
+        return board
+
+    def pack(self):
+        """Return position packed in 33 bytes, for bulk storage.
+
+        Unlike snapshot, number of half moves played is not kept.
+        """
+        return encode_packed(self)
+
+    @classmethod
+    def from_packed(cls, data):
+        """Create a board from a packed position."""
+        return cls(*decode_packed(data))
+
+    # ----------------------------------------------------------------------- #
+    # Instrumentation
+
+    @staticmethod
+    def stats():
+        """Return process wide counters of hot paths, see
+        board.instrumentation (empty unless enabled).
+        """
+        return REGISTRY.stats()
 
     # ----------------------------------------------------------------------- #
     # Display
 
     def board_str(self):
         """Return board representation."""
-        board = BOARD_FORMAT
-        for x, y in Position.iter(8, 8):
-            piece = self._board[x][y]
-            r = " - " if (x + y) % 2 else "   "
-            board = board.replace(
-                "%s %s" % (x, y),
-                piece.repr() if piece else r
-            )
-        return board
+        return RENDERER.render(self)
 
     def display(self):
         """Display board and killed pieces."""
@@ -0,0 +1,220 @@
+"""Compact encodings of board positions."""
+import struct
+
+from parameters import BLACK, WHITE, TOP_COLOR
+from pieces import (
+    Bishop,
+    Queen,
+    King,
+    Knight,
+    Pawn,
+    Rook,
+)
+
+
+PIECE_CLASSES = (Pawn, Knight, Bishop, Rook, Queen, King)
+PIECE_SYMBOLS = "PNBRQK"    # Symbols of PIECE_CLASSES
+
+# Square codes: 0 for an empty square, 1 + class rank + 6 * color otherwise
+PIECE_CODES = {
+    (piece_class, color): 1 + rank + 6 * color
+    for rank, piece_class in enumerate(PIECE_CLASSES)
+    for color in [BLACK, WHITE]
+}
+CODE_PIECES = {code: key for key, code in PIECE_CODES.items()}
+
+# FEN letters of square codes
+FEN_LETTERS = {
+    PIECE_CODES[(piece_class, color)]: (
+        letter if color is WHITE else letter.lower()
+    )
+    for piece_class, letter in zip(PIECE_CLASSES, PIECE_SYMBOLS)
+    for color in [BLACK, WHITE]
+}
+FEN_CODES = {letter: code for code, letter in FEN_LETTERS.items()}
+FEN_CASTLING = (
+    ("K", 1 << (2 * WHITE + 1)),
+    ("Q", 1 << (2 * WHITE)),
+    ("k", 1 << (2 * BLACK + 1)),
+    ("q", 1 << (2 * BLACK)),
+)
+
+# Snapshot: 64 square codes, flags, number of half moves played
+SNAPSHOT = struct.Struct(">64sBH")
+BLACK_TO_PLAY = 0x10    # Flag set when black is to play, low bits are
+                        # castling rights (see Board.castling_rights)
+
+# Packed position: 64 square codes as nibbles, flags
+PACKED = struct.Struct(">32sB")
+
+
+class EncodingError(ValueError):
+    pass
+
+
+def square_codes(board):
+    """Return bytearray of the 64 square codes of board."""
+    codes = bytearray(64)
+    square = 0
+    for row in board._board:
+        for piece in row:
+            if piece is not None and piece.is_alife():
+                codes[square] = PIECE_CODES[(piece.__class__, piece.color)]
+            square += 1
+    return codes
+
+
+def code_placement(codes, castling):
+    """Return placement (see board.start_placement) of square codes.
+
+    Pieces are considered as unmoved only when it matters: pawns on their
+    start row, kings and rooks still having castling rights.
+    """
+    placement = []
+    for square, code in enumerate(codes):
+        if not code:
+            continue
+        try:
+            piece_class, color = CODE_PIECES[code]
+        except KeyError:
+            raise EncodingError("Unknown square code %s" % code)
+        x, y = divmod(square, 8)
+        if piece_class is Pawn:
+            moved = x != (1 if color is TOP_COLOR else 6)
+        elif piece_class is King:
+            moved = not castling & (0b11 << 2 * color)
+        elif piece_class is Rook:
+            moved = not castling & (1 << (2 * color + (y == 7)))
+        else:
+            moved = False
+        placement.append((piece_class, color, x, y, moved))
+    return placement
+
+
+def encode_snapshot(board):
+    """Return snapshot (67 bytes) of board."""
+    flags = board.castling_rights()
+    if board._playing_color is BLACK:
+        flags |= BLACK_TO_PLAY
+    return SNAPSHOT.pack(bytes(square_codes(board)), flags, board.ply)
+
+
+def decode_snapshot(snapshot):
+    """Return (placement, playing color, half moves played) of snapshot."""
+    if len(snapshot) != SNAPSHOT.size:
+        raise EncodingError(
+            "Snapshot must be %s bytes long, not %s"
+            % (SNAPSHOT.size, len(snapshot))
+        )
+    codes, flags, ply = SNAPSHOT.unpack(snapshot)
+    playing_color = BLACK if flags & BLACK_TO_PLAY else WHITE
+    return code_placement(codes, flags & 0xf), playing_color, ply
+
+
+def encode_fen(board):
+    """Return FEN of board.
+
+    Rows are given from x = 0 to x = 7, there is never an en passant
+    square and half move clock is not tracked (always 0).
+    """
+    codes = square_codes(board)
+    rows = []
+    for x in range(8):
+        row = ""
+        empty = 0
+        for code in codes[8 * x:8 * x + 8]:
+            if code:
+                if empty:
+                    row += str(empty)
+                    empty = 0
+                row += FEN_LETTERS[code]
+            else:
+                empty += 1
+        if empty:
+            row += str(empty)
+        rows.append(row)
+
+    castling = board.castling_rights()
+    return "%s %s %s - 0 %s" % (
+        "/".join(rows),
+        "b" if board._playing_color is BLACK else "w",
+        "".join(
+            letter for letter, bit in FEN_CASTLING if castling & bit
+        ) or "-",
+        board.ply // 2 + 1,
+    )
+
+
+def decode_fen(fen):
+    """Return (placement, playing color, half moves played) of FEN."""
+    fields = fen.split()
+    if len(fields) < 2:
+        raise EncodingError("FEN needs placement and color: %r" % fen)
+    rows = fields[0].split("/")
+    if len(rows) != 8:
+        raise EncodingError("FEN placement needs 8 rows: %r" % fields[0])
+
+    codes = bytearray(64)
+    for x, row in enumerate(rows):
+        y = 0
+        for letter in row:
+            if letter.isdigit():
+                y += int(letter)
+                continue
+            code = FEN_CODES.get(letter)
+            if not code or y > 7:
+                raise EncodingError("Can't read FEN row %r" % row)
+            codes[8 * x + y] = code
+            y += 1
+        if y != 8:
+            raise EncodingError("FEN row %r has not 8 squares" % row)
+
+    if fields[1] not in ("w", "b"):
+        raise EncodingError("Can't read FEN color %r" % fields[1])
+    playing_color = BLACK if fields[1] == "b" else WHITE
+
+    castling = 0
+    if len(fields) > 2:
+        for letter, bit in FEN_CASTLING:
+            if letter in fields[2]:
+                castling |= bit
+
+    ply = 0
+    if len(fields) > 5:
+        try:
+            ply = 2 * (int(fields[5]) - 1)
+        except ValueError:
+            raise EncodingError("Can't read FEN move number %r" % fields[5])
+        ply = max(ply, 0) + (playing_color is BLACK)
+    return code_placement(codes, castling), playing_color, ply
+
+
+def encode_packed(board):
+    """Return board position packed in 33 bytes.
+
+    Two square codes per byte, then a byte of flags as for snapshots.
+    Number of half moves played is not kept.
+    """
+    codes = square_codes(board)
+    flags = board.castling_rights()
+    if board._playing_color is BLACK:
+        flags |= BLACK_TO_PLAY
+    return PACKED.pack(
+        bytes(codes[i] << 4 | codes[i + 1] for i in range(0, 64, 2)),
+        flags,
+    )
+
+
+def decode_packed(data):
+    """Return (placement, playing color) of a packed position."""
+    if len(data) != PACKED.size:
+        raise EncodingError(
+            "Packed position must be %s bytes long, not %s"
+            % (PACKED.size, len(data))
+        )
+    nibbles, flags = PACKED.unpack(data)
+    codes = bytearray(64)
+    codes[0::2] = bytes(byte >> 4 for byte in nibbles)
+    codes[1::2] = bytes(byte & 0xf for byte in nibbles)
+    playing_color = BLACK if flags & BLACK_TO_PLAY else WHITE
+    return code_placement(codes, flags & 0xf), playing_color
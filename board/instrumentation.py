@@ -0,0 +1,50 @@
+"""Opt-in instrumentation of move handling hot paths.
+
+    from board import instrumentation
+    instrumentation.enable()
+    ...
+    print(Board.stats())
+"""
+from gameplay import InvalidMove, Move
+from gameplay.moves import Castling, FirstMove
+from gameplay.action import Action
+from pieces.piece import Piece
+from utils.instrumentation import REGISTRY
+
+from .board import Board
+
+
+HOT_PATHS = [
+    # (class, method name, errors counted per reason)
+    (Board, "move", (InvalidMove,)),
+    (Board, "undo", ()),
+    (Board, "board_str", ()),
+    (Move, "check", ()),
+    # Overriding checks, which may raise before calling Move.check
+    (FirstMove, "check", ()),
+    (Castling, "check", ()),
+    (Piece, "get_move", ()),
+    (Action, "apply", ()),
+]
+
+
+def enable():
+    """Start counting hot path calls."""
+    if not REGISTRY.enabled:
+        REGISTRY.enable(HOT_PATHS)
+
+
+def disable():
+    """Stop counting, hot paths get back to their uninstrumented code."""
+    REGISTRY.disable()
+
+
+def reset():
+    """Clear counters."""
+    REGISTRY.reset()
+
+
+def dump(path):
+    """Write counters as JSON to path."""
+    with open(path, "w") as file:
+        REGISTRY.dump(file)
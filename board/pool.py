@@ -0,0 +1,54 @@
+from contextlib import contextmanager
+
+from parameters import WHITE
+
+from .board import Board
+
+
+class BoardPool(object):
+    """Pool of pre-built boards, reset in place and handed out per game."""
+
+    def __init__(self, size=0, max_size=None, board_class=Board):
+        """Create a pool.
+
+        Args:
+            size (int): number of boards to build right away
+            max_size (int): maximum number of idle boards kept, no limit
+                if None
+            board_class (type): class of boards to build
+        """
+        self._board_class = board_class
+        self._max_size = max_size
+        self._free = [board_class() for _ in range(size)]
+
+    def __len__(self):
+        """Return number of idle boards."""
+        return len(self._free)
+
+    def acquire(self, placement=None, playing_color=WHITE):
+        """Return a board set to given placement (start position if None)."""
+        if self._free:
+            board = self._free.pop()
+            if placement is not None or playing_color is not WHITE:
+                board.reset(placement, playing_color)
+            return board
+        return self._board_class(placement, playing_color)
+
+    def release(self, board):
+        """Give back a board once its game is over.
+
+        Boards kept are reset to start position right away, so that idle
+        boards hold no history.
+        """
+        if self._max_size is None or len(self._free) < self._max_size:
+            board.reset()
+            self._free.append(board)
+
+    @contextmanager
+    def game(self, placement=None, playing_color=WHITE):
+        """Provide a board for the duration of a game."""
+        board = self.acquire(placement, playing_color)
+        try:
+            yield board
+        finally:
+            self.release(board)
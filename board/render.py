@@ -0,0 +1,179 @@
+import re
+import threading
+from collections import OrderedDict
+
+from parameters import BLACK, WHITE
+
+
+BOARD_FORMAT = (
+    """
+      a   b   c   d   e   f   g   h
+    +---+---+---+---+---+---+---+---+
+  8 |0 0|0 1|0 2|0 3|0 4|0 5|0 6|0 7| 8
+    +---+---+---+---+---+---+---+---+
+  7 |1 0|1 1|1 2|1 3|1 4|1 5|1 6|1 7| 7
+    +---+---+---+---+---+---+---+---+
+  6 |2 0|2 1|2 2|2 3|2 4|2 5|2 6|2 7| 6
+    +---+---+---+---+---+---+---+---+
+  5 |3 0|3 1|3 2|3 3|3 4|3 5|3 6|3 7| 5
+    +---+---+---+---+---+---+---+---+
+  4 |4 0|4 1|4 2|4 3|4 4|4 5|4 6|4 7| 4
+    +---+---+---+---+---+---+---+---+
+  3 |5 0|5 1|5 2|5 3|5 4|5 5|5 6|5 7| 3
+    +---+---+---+---+---+---+---+---+
+  2 |6 0|6 1|6 2|6 3|6 4|6 5|6 6|6 7| 2
+    +---+---+---+---+---+---+---+---+
+  1 |7 0|7 1|7 2|7 3|7 4|7 5|7 6|7 7| 1
+    +---+---+---+---+---+---+---+---+
+      a   b   c   d   e   f   g   h
+    """
+)
+
+SQUARE_PATTERN = re.compile(r"([0-7]) ([0-7])")    # "x y" in a format
+
+# Representation of empty squares
+EMPTY_CELLS = tuple(
+    " - " if (x + y) % 2 else "   " for x in range(8) for y in range(8)
+)
+
+
+def compile_format(board_format):
+    """Split a board format on its squares.
+
+    Returns:
+        (list, list): literal segments around squares, square index of
+            each square met in format
+    """
+    segments = []
+    squares = []
+    start = 0
+    for match in SQUARE_PATTERN.finditer(board_format):
+        segments.append(board_format[start:match.start()])
+        squares.append(int(match.group(1)) * 8 + int(match.group(2)))
+        start = match.end()
+    segments.append(board_format[start:])
+    return segments, squares
+
+
+def batch_squares(action_batch):
+    """Return square indexes an applied action batch changed."""
+    squares = []
+    for action in action_batch:
+        if action.name == "move":
+            squares.append(action.ukwargs['origin'].square)
+            squares.append(action.ukwargs['dest'].square)
+    return squares
+
+
+class Renderer(object):
+    """Board renderer, caching renders per position (Zobrist key).
+
+    A renderer also follows the history of the last board it made a diff
+    of, so that spectators can be sent the squares changed by moves
+    played or undone since then, see diff.
+
+    render can be called from several threads, diff is meant for a single
+    stream.
+    """
+
+    def __init__(self, board_format=BOARD_FORMAT, cache_size=1024):
+        """Create a renderer.
+
+        Args:
+            board_format (str): text where "x y" stands for square (x, y)
+            cache_size (int): number of positions whose render is kept
+        """
+        self._segments, self._squares = compile_format(board_format)
+        self._cache_size = cache_size
+        self._cache = OrderedDict()     # key: render, LRU first
+        self._cache_lock = threading.Lock()    # Boards may render in threads
+        self._piece_cells = {}          # (class, color): cell
+        # Diff state: board, its history, squares changed by each batch
+        self._history = None
+        self._batches = []
+        self._batch_squares = []
+
+    def cell(self, piece):
+        """Return representation of an active piece."""
+        kind = (piece.__class__, piece.color)
+        cell = self._piece_cells.get(kind)
+        if cell is None:
+            cell = self._piece_cells[kind] = piece.repr()
+        return cell
+
+    def cells(self, board):
+        """Return representation of each square, by square index."""
+        cells = list(EMPTY_CELLS)
+        for color in (BLACK, WHITE):
+            for piece in board.pieces(color):
+                if piece.is_alife():
+                    cells[piece.pos.square] = self.cell(piece)
+        return cells
+
+    def render(self, board):
+        """Return board representation."""
+        key = board.key
+        with self._cache_lock:
+            render = self._cache.get(key)
+            if render is not None:
+                self._cache.move_to_end(key)
+                return render
+
+        cells = self.cells(board)
+        parts = [self._segments[0]]
+        for square, segment in zip(self._squares, self._segments[1:]):
+            parts.append(cells[square])
+            parts.append(segment)
+        render = "".join(parts)
+        with self._cache_lock:
+            self._cache[key] = render
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return render
+
+    def diff(self, board):
+        """Return squares changed since last diff of this renderer.
+
+        Changed squares are those of moves played or undone since then, all
+        squares are given on first call, for another board or once board
+        got reset. Moves made with Board.make are not followed: board must
+        have none left to unmake.
+
+        Returns:
+            (list): (x, y, cell) of changed squares, by square index
+        """
+        assert not board._sp, "Can't diff a board with moves to unmake"
+        history = board._action_batchs
+        if history is not self._history:
+            self._history = history
+            self._batches = list(history)
+            self._batch_squares = [
+                batch_squares(batch) for batch in history
+            ]
+            squares = range(64)
+        else:
+            # Batches shared with last diff, undone ones are replaced
+            batches = self._batches
+            common = min(len(batches), len(history))
+            while common and batches[common - 1] is not history[common - 1]:
+                common -= 1
+            changed = set()
+            for batch_changes in self._batch_squares[common:]:
+                changed.update(batch_changes)
+            del self._batches[common:]
+            del self._batch_squares[common:]
+            for batch in history[common:]:
+                self._batches.append(batch)
+                self._batch_squares.append(batch_squares(batch))
+                changed.update(self._batch_squares[-1])
+            squares = sorted(changed)
+
+        diff = []
+        for square in squares:
+            x, y = divmod(square, 8)
+            piece = board._board[x][y]
+            if piece is not None and piece.is_alife():
+                diff.append((x, y, self.cell(piece)))
+            else:
+                diff.append((x, y, EMPTY_CELLS[square]))
+        return diff
@@ -0,0 +1,183 @@
+import threading
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+
+from gameplay import decode_move
+from parameters import WHITE
+
+from .board import BoardError
+from .pool import BoardPool
+
+
+# Rough resident sizes measured with tracemalloc
+BOARD_MEMORY = 40000    # Board with its pieces
+PLY_MEMORY = 1000       # Action batch of a played move
+
+
+# Game out of memory: snapshot of its start, its move log (see
+# Board.move_log) and snapshot of position reached, to check rehydration
+Hibernated = namedtuple("Hibernated", ["base", "moves", "snapshot"])
+
+
+def board_memory(board):
+    """Return estimated resident size of a board in bytes."""
+    return BOARD_MEMORY + PLY_MEMORY * board.ply
+
+
+class GameStore(object):
+    """Games by id, least recently used idle ones hibernated.
+
+    A hibernated game only keeps its start snapshot and its encoded moves,
+    it is rehydrated by replaying them, so it can still be undone.
+
+    Boards are only reached through checkout / checkin (or use), which
+    keep them in memory meanwhile. Store can be used from several threads,
+    a game by one thread at a time.
+    """
+
+    def __init__(self, max_memory=64 * 2**20, pool=None):
+        """Create a store.
+
+        Args:
+            max_memory (int): ceiling of estimated memory of resident
+                boards, in bytes
+            pool (BoardPool): pool providing boards, default keeps up to
+                16 idle boards
+        """
+        self._max_memory = max_memory
+        self._pool = BoardPool(max_size=16) if pool is None else pool
+        self._resident = OrderedDict()  # id: (board, base), LRU first
+        self._sizes = {}                # id: estimated memory of board
+        self._memory = 0                # Sum of sizes
+        self._hibernated = {}           # id: Hibernated
+        self._in_use = set()
+        self._lock = threading.RLock()
+
+    def __contains__(self, game_id):
+        return game_id in self._resident or game_id in self._hibernated
+
+    def __len__(self):
+        return len(self._resident) + len(self._hibernated)
+
+    def resident(self):
+        """Return number of games in memory."""
+        return len(self._resident)
+
+    def memory(self):
+        """Return estimated memory of resident boards in bytes.
+
+        Boards are measured when checked in.
+        """
+        return self._memory
+
+    def create(self, game_id, placement=None, playing_color=WHITE):
+        """Create a game, set to given placement (start position if None).
+        """
+        with self._lock:
+            if game_id in self or game_id in self._in_use:
+                raise KeyError("Game %s already exists" % game_id)
+            board = self._pool.acquire(placement, playing_color)
+            self._add(game_id, board, board.snapshot())
+            self._shrink()
+
+    def discard(self, game_id):
+        """Remove a game from store."""
+        with self._lock:
+            if game_id in self._in_use:
+                raise BoardError(
+                    "Can't discard game %s while in use" % game_id
+                )
+            if game_id in self._hibernated:
+                del self._hibernated[game_id]
+            else:
+                board, _ = self._remove(game_id)
+                self._pool.release(board)
+
+    def checkout(self, game_id):
+        """Return board of a game, rehydrating it if needed.
+
+        Board is kept in memory until checkin.
+        """
+        with self._lock:
+            if game_id in self._in_use:
+                raise BoardError("Game %s is already in use" % game_id)
+            if game_id in self._resident:
+                self._resident.move_to_end(game_id)
+                self._in_use.add(game_id)
+                return self._resident[game_id][0]
+            try:
+                hibernated = self._hibernated.pop(game_id)
+            except KeyError:
+                raise KeyError("Unknown game %s" % game_id)
+            self._in_use.add(game_id)
+            board = self._pool.acquire()
+
+        # Replay out of lock, game is neither resident nor hibernated
+        try:
+            board.load_snapshot(hibernated.base)
+            for code in hibernated.moves:
+                board.play(board._get_move(*decode_move(code)))
+            if board.snapshot() != hibernated.snapshot:
+                raise BoardError("Game %s could not be rehydrated" % game_id)
+        except Exception:
+            with self._lock:
+                self._hibernated[game_id] = hibernated
+                self._in_use.discard(game_id)
+                self._pool.release(board)
+            raise
+        with self._lock:
+            self._add(game_id, board, hibernated.base)
+        return board
+
+    def checkin(self, game_id):
+        """Give back board of a game, hibernating idle games if needed."""
+        with self._lock:
+            self._in_use.discard(game_id)
+            if game_id in self._resident:
+                size = board_memory(self._resident[game_id][0])
+                self._memory += size - self._sizes[game_id]
+                self._sizes[game_id] = size
+            self._shrink()
+
+    @contextmanager
+    def use(self, game_id):
+        """Provide board of a game, see checkout."""
+        board = self.checkout(game_id)
+        try:
+            yield board
+        finally:
+            self.checkin(game_id)
+
+    def hibernate(self, game_id):
+        """Put a game out of memory."""
+        with self._lock:
+            if game_id in self._in_use:
+                raise BoardError(
+                    "Can't hibernate game %s while in use" % game_id
+                )
+            board, base = self._remove(game_id)
+            self._hibernated[game_id] = Hibernated(
+                base, board.move_log(), board.snapshot()
+            )
+            self._pool.release(board)
+
+    def _add(self, game_id, board, base):
+        self._resident[game_id] = (board, base)
+        self._sizes[game_id] = board_memory(board)
+        self._memory += self._sizes[game_id]
+
+    def _remove(self, game_id):
+        self._memory -= self._sizes.pop(game_id)
+        return self._resident.pop(game_id)
+
+    def _shrink(self):
+        """Hibernate idle games, least recently used first, until memory
+        fits in ceiling.
+        """
+        if self._memory <= self._max_memory:
+            return
+        for game_id in list(self._resident):
+            if self._memory <= self._max_memory:
+                break
+            if game_id not in self._in_use:
+                self.hibernate(game_id)
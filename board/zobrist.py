@@ -0,0 +1,25 @@
+"""Random keys used to hash positions (Zobrist hashing).
+
+A position key is the xor of:
+    - PIECE_KEYS[color][symbol][square] for each active piece
+    - CASTLING_KEYS[rights] where rights is Board.castling_rights()
+    - SIDE_KEY if black is to play
+"""
+import random
+
+from parameters import BLACK, WHITE
+
+
+SEED = 20180301
+
+_random = random.Random(SEED)
+
+PIECE_KEYS = {
+    color: {
+        symbol: [_random.getrandbits(64) for _ in range(64)]
+        for symbol in "PNBRQK"
+    }
+    for color in [BLACK, WHITE]
+}
+CASTLING_KEYS = [_random.getrandbits(64) for _ in range(16)]
+SIDE_KEY = _random.getrandbits(64)
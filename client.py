@@ -0,0 +1,38 @@
+"""Minimal client of server.py: send input lines, print answers.
+
+Usage:
+    python client.py --port 8765
+"""
+import argparse
+import asyncio
+import sys
+
+
+async def run(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                break
+            writer.write(line.encode())
+            await writer.drain()
+            answer = await reader.readline()
+            if not answer:
+                break
+            print(answer.decode().rstrip())
+    finally:
+        writer.close()
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(args)
+    asyncio.run(run(args.host, args.port))
+
+
+if __name__ == '__main__':
+    main()
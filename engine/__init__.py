@@ -0,0 +1,4 @@
+from .evaluation import evaluate
+from .parallel import ParallelSearcher
+from .search import SearchResult, Searcher
+from .transposition import EXACT, LOWER, UPPER, TranspositionTable
@@ -0,0 +1,94 @@
+"""Vectorized features and evaluation of many positions, using NumPy.
+
+Positions are turned into an (N, 64) array of square codes (see
+board.encoding), from which features are computed for the whole batch at
+once. NumPy is only needed by this module.
+"""
+import numpy as np
+
+from board.encoding import (
+    BLACK_TO_PLAY,
+    CODE_PIECES,
+    PIECE_CLASSES,
+    PIECE_SYMBOLS,
+    SNAPSHOT,
+    square_codes,
+)
+from board.scores import PIECE_VALUES, SQUARE_SCORES
+from parameters import BLACK, WHITE
+
+
+def _code_tables():
+    """Return (values, scores) tables indexed by square code.
+
+    values (2, 13): piece value of code for each color, 0 for the other one
+    scores (13, 64): signed score of code on each square, positive for white
+    """
+    values = np.zeros((2, 13), dtype=np.int32)
+    scores = np.zeros((13, 64), dtype=np.int32)
+    for code, (piece_class, color) in CODE_PIECES.items():
+        symbol = PIECE_SYMBOLS[PIECE_CLASSES.index(piece_class)]
+        values[color, code] = PIECE_VALUES[symbol]
+        sign = 1 if color is WHITE else -1
+        scores[code] = sign * np.array(SQUARE_SCORES[color][symbol])
+    return values, scores
+
+
+CODE_VALUES, CODE_SCORES = _code_tables()
+SQUARES = np.arange(64)
+
+
+def to_array(positions):
+    """Return (N, 64) uint8 array of square codes.
+
+    Args:
+        positions (list): boards or snapshots (see Board.snapshot), not
+            mixed
+    """
+    if positions and isinstance(positions[0], (bytes, bytearray)):
+        data = np.frombuffer(b"".join(positions), dtype=np.uint8)
+        return data.reshape(len(positions), SNAPSHOT.size)[:, :64].copy()
+    codes = np.zeros((len(positions), 64), dtype=np.uint8)
+    for i, board in enumerate(positions):
+        codes[i] = np.frombuffer(bytes(square_codes(board)), dtype=np.uint8)
+    return codes
+
+
+def to_colors(positions):
+    """Return (N,) array of colors to play."""
+    if positions and isinstance(positions[0], (bytes, bytearray)):
+        data = np.frombuffer(b"".join(positions), dtype=np.uint8)
+        flags = data.reshape(len(positions), SNAPSHOT.size)[:, 64]
+        return np.where(flags & BLACK_TO_PLAY, BLACK, WHITE)
+    return np.array([board.playing_color for board in positions])
+
+
+def to_planes(codes):
+    """Return (N, 12, 64) boolean array, one plane per piece code."""
+    return codes[:, None, :] == np.arange(1, 13, dtype=np.uint8)[:, None]
+
+
+def piece_counts(codes):
+    """Return (N, 12) array of number of pieces per piece code."""
+    return to_planes(codes).sum(axis=2)
+
+
+def material(codes):
+    """Return (N, 2) array of material values per color."""
+    return np.stack(
+        [CODE_VALUES[BLACK][codes].sum(axis=1),
+         CODE_VALUES[WHITE][codes].sum(axis=1)],
+        axis=1,
+    )
+
+
+def evaluate(codes, colors=None):
+    """Return (N,) array of material and piece-square evaluations.
+
+    Same as Board.evaluate, but scores are given from white point of view
+    unless colors (see to_colors) are given.
+    """
+    scores = CODE_SCORES[codes, SQUARES].sum(axis=1)
+    if colors is not None:
+        scores = np.where(colors == WHITE, scores, -scores)
+    return scores
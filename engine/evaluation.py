@@ -0,0 +1,10 @@
+"""Static evaluation of positions."""
+
+
+def evaluate(board):
+    """Return score of position from current player point of view.
+
+    Material and piece-square scores are kept up to date by the board, so
+    that evaluation costs no scan of pieces.
+    """
+    return board.evaluate()
@@ -0,0 +1,133 @@
+"""Search splitting root moves between worker processes.
+
+Pure Python search is bound to a single core by the GIL, so each worker is
+a process owning its Board and Searcher (and so its transposition table,
+kept between searches). At each depth, every root move is searched by a
+worker and the main process picks the best one.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from board import BitBoard
+
+from .search import MATE, MATE_BOUND, SearchResult, Searcher
+from .transposition import TranspositionTable
+
+
+_searcher = None    # Searcher of a worker process
+
+
+def _init_worker(table_mb):
+    global _searcher
+    _searcher = Searcher(TranspositionTable(size_mb=table_mb))
+
+
+def _search_move(snapshot, move, depth, deadline):
+    """Search position after move, in a worker process.
+
+    Args:
+        snapshot (bytes): position, see Board.snapshot
+        move (tuple): (origin, destination) of root move
+        depth (int): depth to search after move
+        deadline (float): time.time() after which search is abandoned
+
+    Returns:
+        (int, list, int): score, principal variation, nodes; score and
+            variation are None when deadline was reached
+    """
+    board = BitBoard.from_snapshot(snapshot)
+    board.move(*move)
+    time_limit = None if deadline is None else deadline - time.time()
+    if time_limit is not None and time_limit <= 0:
+        return None, None, 0
+    found = _searcher.search_depth(board, depth, time_limit=time_limit)
+    if found is None:
+        return None, None, _searcher.nodes
+    score, pv = found
+    return score, pv, _searcher.nodes
+
+
+def parent_score(score):
+    """Return score of a move given score of position it leads to."""
+    if score > MATE_BOUND:
+        return -score + 1
+    elif score < -MATE_BOUND:
+        return -score - 1
+    return -score
+
+
+class ParallelSearcher(object):
+    """Search best move using several processes."""
+
+    def __init__(self, processes=None, table_mb=16):
+        """Create searcher and start its workers.
+
+        Args:
+            processes (int): number of workers, one per core if None
+            table_mb (int): transposition table size of each worker in MiB
+        """
+        self._pool = ProcessPoolExecutor(
+            processes or os.cpu_count() or 1,
+            initializer=_init_worker,
+            initargs=(table_mb,),
+        )
+
+    def close(self):
+        """Stop workers."""
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def search(self, board, max_depth=64, time_limit=None):
+        """Return SearchResult of best move for current player of board.
+
+        See Searcher.search, budget can only be a time limit.
+        """
+        start = time.perf_counter()
+        deadline = None if time_limit is None else time.time() + time_limit
+        snapshot = board.snapshot()
+        moves = [
+            (move.get_origin().t, move.get_destination().t)
+            for move in board.legal_moves()
+        ]
+        if not moves:
+            score = -MATE if board.is_in_check() else 0
+            return SearchResult(None, score, 0, [], 0, 0.)
+
+        nodes = 0
+        result = SearchResult(moves[0], None, 0, [moves[0]], 0, 0.)
+        for depth in range(1, max_depth + 1):
+            futures = [
+                self._pool.submit(
+                    _search_move, snapshot, move, depth - 1, deadline
+                )
+                for move in moves
+            ]
+            scores = {}
+            complete = True
+            for move, future in zip(moves, futures):
+                score, pv, move_nodes = future.result()
+                nodes += move_nodes
+                if score is None:
+                    complete = False
+                else:
+                    scores[move] = parent_score(score), pv
+            if not complete:
+                break
+
+            # Best moves first for next depth
+            moves.sort(key=lambda move: scores[move][0], reverse=True)
+            best = moves[0]
+            score, pv = scores[best]
+            result = SearchResult(
+                best, score, depth, [best] + pv,
+                nodes, time.perf_counter() - start,
+            )
+            if abs(score) > MATE_BOUND:
+                break
+        return result._replace(nodes=nodes)
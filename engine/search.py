@@ -0,0 +1,286 @@
+"""Negamax alpha-beta search with iterative deepening."""
+import time
+from collections import namedtuple
+
+from board.scores import PIECE_VALUES
+from gameplay import decode_move, encode_move
+
+from .evaluation import evaluate
+from .transposition import EXACT, LOWER, UPPER, TranspositionTable
+
+
+MATE = 100000
+INFINITY = 10 * MATE
+MATE_BOUND = MATE - 1000    # Scores beyond are mates
+
+SearchResult = namedtuple(
+    "SearchResult",
+    [
+        "move",     # Best move as (origin, destination) for Board.move
+        "score",    # Score of best move from player point of view
+        "depth",    # Depth of last completed iteration
+        "pv",       # Principal variation, list of moves as above
+        "nodes",    # Number of visited nodes
+        "time",     # Elapsed time in seconds
+    ]
+)
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+def move_pair(code):
+    """Return (origin, destination) tuples of an encoded move."""
+    origin, destination = decode_move(code)
+    return origin.t, destination.t
+
+
+class Searcher(object):
+    """Search best move of a position.
+
+    Searcher keeps its transposition table and history between searches.
+    """
+
+    MAX_PLY = 128
+
+    def __init__(self, table=None, evaluate=evaluate):
+        """Create a searcher.
+
+        Args:
+            table (TranspositionTable): table to use, a 16 MiB one if None
+            evaluate (callable): board -> score from player point of view
+        """
+        self.table = table if table is not None else TranspositionTable()
+        self.evaluate = evaluate
+        self.nodes = 0
+        self._deadline = None
+        self._node_limit = None
+        self._killers = [[None, None] for _ in range(self.MAX_PLY)]
+        self._history = [0] * 4096
+        self._pv = [[] for _ in range(self.MAX_PLY + 1)]
+
+    # ----------------------------------------------------------------------- #
+    # Search
+
+    def search(self, board, max_depth=64, time_limit=None, node_limit=None):
+        """Return SearchResult of best move for current player of board.
+
+        Search deepens until max_depth is reached or budget is exhausted,
+        result is the one of the last completed depth. Board is left as is.
+
+        Args:
+            board (board.Board): position to search
+            max_depth (int): maximum depth in plies
+            time_limit (float): wall-clock budget in seconds
+            node_limit (int): budget in number of nodes
+        """
+        start = time.perf_counter()
+        self._start(time_limit, node_limit)
+
+        result = None
+        for depth in range(1, max_depth + 1):
+            try:
+                score = self._negamax(board, depth, -INFINITY, INFINITY, 0)
+            except SearchTimeout:
+                break
+            pv = [move_pair(code) for code in self._pv[0]]
+            result = SearchResult(
+                pv[0] if pv else None, score, depth, pv,
+                self.nodes, time.perf_counter() - start,
+            )
+            if not pv or abs(score) > MATE_BOUND:
+                break
+
+        if result is None:
+            # Not even depth 1 could be completed
+            move = None
+            moves = self._order(board, board.legal_moves(), None, 0)
+            if moves:
+                move = (
+                    moves[0].get_origin().t,
+                    moves[0].get_destination().t,
+                )
+            result = SearchResult(
+                move, None, 0, [move] if move else [],
+                self.nodes, time.perf_counter() - start,
+            )
+        return result
+
+    def search_depth(self, board, depth, time_limit=None, node_limit=None):
+        """Search position at a fixed depth, without iterative deepening.
+
+        Returns:
+            (int, list): score and principal variation, None if budget got
+                exhausted before the end
+        """
+        self._start(time_limit, node_limit)
+        try:
+            score = self._negamax(board, depth, -INFINITY, INFINITY, 0)
+        except SearchTimeout:
+            return None
+        return score, [move_pair(code) for code in self._pv[0]]
+
+    def _start(self, time_limit, node_limit):
+        """Reset counters and budget before a search."""
+        self.nodes = 0
+        self._deadline = (
+            None if time_limit is None else time.perf_counter() + time_limit
+        )
+        self._node_limit = node_limit
+        for killers in self._killers:
+            killers[0] = killers[1] = None
+
+    def _check_budget(self):
+        """Count a node, raise SearchTimeout once budget is exhausted.
+
+        Clock is read at every node: a node generates all legal moves, so
+        it costs far more than reading the clock.
+        """
+        self.nodes += 1
+        if self._node_limit is not None and self.nodes >= self._node_limit:
+            raise SearchTimeout
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise SearchTimeout
+
+    def _negamax(self, board, depth, alpha, beta, ply):
+        """Return score of position, filling principal variation of ply.
+
+        Principal variations are lists of encoded moves, as moves are bound
+        to pieces whose positions change while searching.
+        """
+        self._check_budget()
+        self._pv[ply] = []
+        if depth <= 0 or ply >= self.MAX_PLY:
+            return self._quiesce(board, alpha, beta, ply)
+
+        key = board.key
+        tt_move = None
+        entry = self.table.probe(key)
+        if entry is not None:
+            tt_move = entry.move
+            if ply > 0 and entry.depth >= depth:
+                score = from_table(entry.score, ply)
+                if entry.flag == EXACT:
+                    return score
+                elif entry.flag == LOWER:
+                    alpha = max(alpha, score)
+                elif entry.flag == UPPER:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        moves = board.legal_moves()
+        if not moves:
+            return -MATE + ply if board.is_in_check() else 0
+
+        alpha_orig = alpha
+        best_score = -INFINITY
+        best_code = None
+        for move in self._order(board, moves, tt_move, ply):
+            capture = board.get(move.get_destination()) is not None
+            code = encode_move(move.get_origin(), move.get_destination())
+            board.make(move)
+            try:
+                score = -self._negamax(
+                    board, depth - 1, -beta, -alpha, ply + 1
+                )
+            finally:
+                board.unmake()
+            if score > best_score:
+                best_score = score
+                best_code = code
+                self._pv[ply] = [code] + self._pv[ply + 1]
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                if not capture:
+                    killers = self._killers[ply]
+                    if killers[0] != code:
+                        killers[0], killers[1] = code, killers[0]
+                    self._history[code] += depth * depth
+                break
+
+        if best_score <= alpha_orig:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table.store(
+            key, min(depth, 255), to_table(best_score, ply), flag, best_code
+        )
+        return best_score
+
+    def _quiesce(self, board, alpha, beta, ply):
+        """Return score of position, only looking at captures."""
+        stand_pat = self.evaluate(board)
+        if stand_pat >= beta or ply >= self.MAX_PLY:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        captures = [
+            move for move in board.legal_moves()
+            if board.get(move.get_destination()) is not None
+        ]
+        for move in self._order(board, captures, None, ply):
+            self._check_budget()
+            board.make(move)
+            try:
+                score = -self._quiesce(board, -beta, -alpha, ply + 1)
+            finally:
+                board.unmake()
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+        return alpha
+
+    # ----------------------------------------------------------------------- #
+    # Move ordering
+
+    def _order(self, board, moves, tt_move, ply):
+        """Return moves sorted from most to least promising.
+
+        Table move first, then captures by most valuable victim and least
+        valuable attacker, then killer moves, then by history.
+        """
+        killers = self._killers[ply] if ply < self.MAX_PLY else (None, None)
+        history = self._history
+
+        def priority(move):
+            code = encode_move(move.get_origin(), move.get_destination())
+            if code == tt_move:
+                return 1 << 30
+            victim = board.get(move.get_destination())
+            if victim is not None:
+                return (1 << 29) + (
+                    10 * PIECE_VALUES[victim.symbol()]
+                    - PIECE_VALUES[move.piece.symbol()]
+                )
+            if code == killers[0]:
+                return 1 << 28
+            if code == killers[1]:
+                return (1 << 28) - 1
+            return history[code]
+
+        return sorted(moves, key=priority, reverse=True)
+
+
+def to_table(score, ply):
+    """Make mate scores relative to node before storing them."""
+    if score > MATE_BOUND:
+        return score + ply
+    elif score < -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def from_table(score, ply):
+    """Make stored mate scores relative to root again."""
+    if score > MATE_BOUND:
+        return score - ply
+    elif score < -MATE_BOUND:
+        return score + ply
+    return score
@@ -0,0 +1,114 @@
+from array import array
+from collections import namedtuple
+
+
+# Bound types
+EXACT = 1   # Score is exact
+LOWER = 2   # Score is a lower bound (search failed high)
+UPPER = 3   # Score is an upper bound (search failed low)
+
+Entry = namedtuple("Entry", ["depth", "score", "flag", "move"])
+
+SCORE_OFFSET = 1 << 31
+
+
+class TranspositionTable(object):
+    """Fixed size table of search results keyed by position key.
+
+    Table is a preallocated array of buckets of 2 slots: first slot keeps
+    the deepest result, second slot is always replaced. Each slot holds
+    the full 64 bit key and a 64 bit word packing:
+        - depth (8 bits)
+        - flag (2 bits, 0 for empty slot)
+        - move (13 bits, encoded move + 1, 0 for no move)
+        - score (32 bits, signed)
+    """
+
+    SLOT_SIZE = 16  # bytes
+
+    def __init__(self, size_mb=16):
+        """Create a table using at most size_mb MiB."""
+        buckets = max(1, (size_mb << 20) // (2 * self.SLOT_SIZE))
+        buckets = 1 << (buckets.bit_length() - 1)
+        self._mask = buckets - 1
+        self._keys = array("Q", bytes(16 * buckets))
+        self._data = array("Q", bytes(16 * buckets))
+
+    def __len__(self):
+        """Return number of slots."""
+        return len(self._keys)
+
+    @property
+    def size(self):
+        """Return table memory size in bytes."""
+        return len(self) * self.SLOT_SIZE
+
+    def clear(self):
+        """Empty table."""
+        for i in range(len(self)):
+            self._keys[i] = 0
+            self._data[i] = 0
+
+    def usage(self):
+        """Return ratio of used slots."""
+        return sum(1 for data in self._data if data) / len(self)
+
+    @staticmethod
+    def _pack(depth, score, flag, move):
+        move = 0 if move is None else move + 1
+        return (
+            (score + SCORE_OFFSET) << 23
+            | move << 10
+            | flag << 8
+            | depth
+        )
+
+    @staticmethod
+    def _unpack(data):
+        move = (data >> 10) & 0x1fff
+        return Entry(
+            depth=data & 0xff,
+            score=(data >> 23) - SCORE_OFFSET,
+            flag=(data >> 8) & 0x3,
+            move=move - 1 if move else None,
+        )
+
+    def probe(self, key):
+        """Return entry stored for key, None if there is none."""
+        i = (key & self._mask) << 1
+        keys = self._keys
+        if keys[i] == key and self._data[i]:
+            return self._unpack(self._data[i])
+        if keys[i + 1] == key and self._data[i + 1]:
+            return self._unpack(self._data[i + 1])
+        return None
+
+    def store(self, key, depth, score, flag, move=None):
+        """Store a search result.
+
+        Args:
+            key (int): 64 bits position key
+            depth (int): searched depth (0..255)
+            score (int): score of position
+            flag (int): EXACT, LOWER or UPPER
+            move (int): best move, as given by gameplay.encode_move
+        """
+        i = (key & self._mask) << 1
+        keys, datas = self._keys, self._data
+
+        # Keep known best move when none is given
+        if move is None:
+            for j in (i, i + 1):
+                if keys[j] == key and datas[j]:
+                    move = self._unpack(datas[j]).move
+                    break
+
+        data = self._pack(depth, score, flag, move)
+        if (
+            keys[i] == key
+            or not datas[i]
+            or depth >= (datas[i] & 0xff)
+        ):
+            keys[i], datas[i] = key, data
+        else:
+            keys[i + 1], datas[i + 1] = key, data
@@ -1,2 +1,2 @@
 from .errors import InvalidMove
-from .moves import Move
+from .moves import Move, decode_move, encode_move
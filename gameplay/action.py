@@ -8,6 +8,15 @@ class Action(object):
         self._kwargs = kwargs   # Key arguments to perfom action
         self._ukwargs = None    # Key arguments to undo action
 
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def ukwargs(self):
+        """Key arguments to undo action, None if action is not applied."""
+        return self._ukwargs
+
     def apply(self, board):
         """Apply action on board.
 
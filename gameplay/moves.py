@@ -1,21 +1,67 @@
-from utils import Vector
+from collections import namedtuple
+
+from utils import Position, Vector
 
 from .action import Action, ActionBatch
 from .errors import InvalidMove
 
 
+def encode_move(origin, destination):
+    """Encode a move as a 12 bits integer.
+
+    Args:
+        origin (Position): origin of moving piece
+        destination (Position): destination of moving piece
+    """
+    return origin.square << 6 | destination.square
+
+
+def decode_move(code):
+    """Return (origin, destination) positions of an encoded move."""
+    return Position.from_square(code >> 6), Position.from_square(code & 63)
+
+
+class MoveSpec(
+    namedtuple("MoveSpec", ["kind", "direction", "steps", "vector"])
+):
+    """Piece independent definition of a move.
+
+    Specs are shared by all pieces of a same class and color, moves are
+    only created when needed with bind.
+    """
+
+    __slots__ = ()
+
+    def bind(self, piece):
+        """Return move of given piece."""
+        return self.kind(piece, self.direction, self.steps)
+
+
 class Move(object):
     """Basic move.
 
     A piece, a direction and a number of steps.
     """
 
+    # Whether piece attacks destination with that move
+    attacks = True
+    # Whether move also moves a rook
+    castling = False
+
     def __init__(self, piece, direction, steps=1):
-        self._dir = Vector(direction)
+        self._dir = (
+            direction if direction.__class__ is Vector else Vector(direction)
+        )
         self._piece = piece
         self._steps = steps
         self._vector = self._dir * self.steps
 
+    @classmethod
+    def spec(cls, direction, steps=1):
+        """Return MoveSpec of this kind of move."""
+        direction = Vector(direction)
+        return MoveSpec(cls, direction, steps, direction * steps)
+
     # Utils
 
     @property
@@ -91,9 +137,9 @@ class Move(object):
 
     def check_path(self, cpos, board):
         """Watch out for pieces along the ways."""
-        for int_pos in self.direction.iter(cpos, self.steps-1):
-            if board.get(int_pos):
-                raise InvalidMove("Bump into someone at %s" % int_pos)
+        int_pos = board.first_blocker(cpos, self.direction, self.steps-1)
+        if int_pos is not None:
+            raise InvalidMove("Bump into someone at %s" % int_pos)
         return True
 
 
@@ -111,6 +157,8 @@ class CaptureMove(Move):
 class PeaceMove(Move):
     """A move that must reach an empty square."""
 
+    attacks = False
+
     def check_destination(self, npos, board):
         """Check whether there is an enemy at destination."""
         npiece = board.get(npos)
@@ -131,18 +179,21 @@ class FirstMove(PeaceMove):
 class Castling(Move):
     """Castling."""
 
-    def __init__(self, piece, direction):
+    attacks = False
+    castling = True
+
+    def __init__(self, piece, direction, steps=2):
         assert piece.__class__.__name__ == "King"
         super().__init__(
             piece,
             direction=direction,
-            steps=2,
+            steps=steps,
+        )
+        origin = piece.origin
+        self._corner = Position.of(
+            origin.x, 0 if self.direction.y < 0 else 7
         )
-        self._corner = piece.origin
-        self._dist_to_corner = 0
-        while 0 < self._corner.y < 7:
-            self._dist_to_corner += 1
-            self._corner = self._corner + self.direction
+        self._dist_to_corner = abs(self._corner.y - origin.y)
 
     @property
     def corner(self):
@@ -173,14 +224,20 @@ class Castling(Move):
         if self.piece.has_moved():
             raise InvalidMove("Can't castle when King has moved")
         super().check(board)
+        enemy = 1 - self.piece.color
+        if board.is_attacked(self.get_origin(), enemy):
+            raise InvalidMove("Can't castle when in check")
+        if board.is_attacked(self.get_origin() + self.direction, enemy):
+            raise InvalidMove("Can't castle through an attacked square")
 
     def check_destination(self, npos, board):
         return True
 
     def check_path(self, cpos, board):
-        for int_pos in self.direction.iter(cpos, self.dist_to_corner - 1):
-            if board.get(int_pos):
-                raise InvalidMove("Can't castle when a piece is along the way")
+        if board.first_blocker(
+            cpos, self.direction, self.dist_to_corner - 1
+        ) is not None:
+            raise InvalidMove("Can't castle when a piece is along the way")
         corner_piece = board.get(self.corner)
         if (
             corner_piece is None
@@ -195,18 +252,20 @@ class Castling(Move):
 class LCastling(Castling):
     """Castling on the left."""
 
-    def __init__(self, piece):
+    def __init__(self, piece, direction=(0, -1), steps=2):
         super().__init__(
             piece,
-            direction=(0, -1),
+            direction=direction,
+            steps=steps,
         )
 
 
 class RCastling(Castling):
     """Castling on the right."""
 
-    def __init__(self, piece):
+    def __init__(self, piece, direction=(0, 1), steps=2):
         super().__init__(
             piece,
-            direction=(0, 1),
+            direction=direction,
+            steps=steps,
         )
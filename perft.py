@@ -0,0 +1,98 @@
+"""Count leaf nodes of the move tree, as a correctness and speed benchmark.
+
+Usage:
+    python perft.py 3
+    python perft.py 3 --divide --moves "e2 e4" "e7 e5"
+    python perft.py 2 --fen "4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1"
+"""
+import argparse
+import sys
+import time
+
+from board import BitBoard
+from play import read_input, write_position
+
+
+# Known leaf counts from start position
+REFERENCE_COUNTS = {
+    1: 20,
+    2: 400,
+    3: 8902,
+    4: 197281,
+}
+
+
+def move_str(move):
+    """Return move in play.read_input syntax."""
+    return "%s %s" % (
+        write_position(*move.get_origin().t),
+        write_position(*move.get_destination().t),
+    )
+
+
+def perft(board, depth):
+    """Return number of leaf nodes at given depth."""
+    moves = board.legal_moves()
+    if depth <= 1:
+        return len(moves) if depth == 1 else 1
+    nodes = 0
+    for move in moves:
+        board.make(move)
+        nodes += perft(board, depth - 1)
+        board.unmake()
+    return nodes
+
+
+def divide(board, depth):
+    """Return number of leaf nodes at given depth per root move."""
+    counts = {}
+    for move in board.legal_moves():
+        name = move_str(move)
+        board.make(move)
+        counts[name] = perft(board, depth - 1)
+        board.unmake()
+    return counts
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("depth", type=int)
+    parser.add_argument("--fen", help="start from given position")
+    parser.add_argument(
+        "--moves", nargs="*", default=[],
+        help="moves to play before counting, such as 'e2 e4'",
+    )
+    parser.add_argument(
+        "--divide", action="store_true",
+        help="give counts per root move",
+    )
+    args = parser.parse_args(args)
+
+    board = BitBoard.from_fen(args.fen) if args.fen else BitBoard()
+    for move in args.moves:
+        board.move(*read_input(move))
+
+    start = time.perf_counter()
+    if args.divide:
+        counts = divide(board, args.depth)
+        for name in sorted(counts):
+            print("%s: %s" % (name, counts[name]))
+        nodes = sum(counts.values())
+    else:
+        nodes = perft(board, args.depth)
+    elapsed = time.perf_counter() - start
+
+    print("Nodes: %s" % nodes)
+    print("Time: %.3fs" % elapsed)
+    print("Nodes/s: %.0f" % (nodes / elapsed if elapsed else 0))
+
+    expected = REFERENCE_COUNTS.get(args.depth)
+    if not args.moves and not args.fen and expected is not None:
+        status = "OK" if nodes == expected else "MISMATCH"
+        print("Reference: %s (%s)" % (expected, status))
+        return 0 if nodes == expected else 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,14 +6,16 @@ from gameplay.moves import Move, LCastling, RCastling
 
 class King(Piece):
 
-    def init_moves(self):
-        self._moves = []
+    @classmethod
+    def move_specs(cls, color):
+        specs = []
         for dpos in itertools.product([-1, 0, 1], [-1, 0, 1]):
             if dpos == (0, 0):
                 continue
-            self._moves.append(Move(self, dpos))
-        self._moves.append(LCastling(self))
-        self._moves.append(RCastling(self))
+            specs.append(Move.spec(dpos))
+        specs.append(LCastling.spec((0, -1), steps=2))
+        specs.append(RCastling.spec((0, 1), steps=2))
+        return specs
 
     def symbol(self):
         return "K"
@@ -4,17 +4,19 @@ from gameplay.moves import Move
 
 class Knight(Piece):
 
-    def init_moves(self):
-        self._can_cross = True
-        self._moves = [
-            Move(self, (+2, +1)),
-            Move(self, (+2, -1)),
-            Move(self, (-2, +1)),
-            Move(self, (-2, -1)),
-            Move(self, (+1, +2)),
-            Move(self, (+1, -2)),
-            Move(self, (-1, +2)),
-            Move(self, (-1, -2)),
+    _can_cross = True
+
+    @classmethod
+    def move_specs(cls, color):
+        return [
+            Move.spec((+2, +1)),
+            Move.spec((+2, -1)),
+            Move.spec((-2, +1)),
+            Move.spec((-2, -1)),
+            Move.spec((+1, +2)),
+            Move.spec((+1, -2)),
+            Move.spec((-1, +2)),
+            Move.spec((-1, -2)),
         ]
 
     def symbol(self):
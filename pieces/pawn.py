@@ -1,4 +1,5 @@
 from gameplay.moves import CaptureMove, FirstMove, PeaceMove
+from parameters import TOP_COLOR
 from utils import Vector
 
 from .piece import Piece
@@ -9,12 +10,14 @@ class Pawn(Piece):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-    def init_moves(self):
-        self._moves = [
-            PeaceMove(self, self.dir * Vector(1, 0)),
-            CaptureMove(self, self.dir * Vector(1, 1)),
-            CaptureMove(self, self.dir * Vector(1, -1)),
-            FirstMove(self, self.dir * Vector(1, 0), steps=2)
+    @classmethod
+    def move_specs(cls, color):
+        direction = Vector(1, 1) if color is TOP_COLOR else Vector(-1, 1)
+        return [
+            PeaceMove.spec(direction * Vector(1, 0)),
+            CaptureMove.spec(direction * Vector(1, 1)),
+            CaptureMove.spec(direction * Vector(1, -1)),
+            FirstMove.spec(direction * Vector(1, 0), steps=2)
         ]
 
     def symbol(self):
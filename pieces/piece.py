@@ -5,33 +5,93 @@ from utils import Position, Vector
 
 class Piece(object):
 
-    pieces = {
-        BLACK: [],
-        WHITE: []
-    }
-    count = 0
+    # Whether piece attacks along lines, so that its attacks depend on
+    # other pieces positions
+    slider = False
 
-    def __init__(self, x, y, color):
-        self._alife = True
+    # Move tables, shared by pieces of same class and color
+    move_tables = {}
+    # Attack ray tables, shared by pieces of same class and color
+    attack_tables = {}
+
+    def __init__(self, x, y, color, moved=False):
         self._color = color
         self._direction = (
             Vector(1, 1) if self._color is TOP_COLOR else Vector(-1, 1)
         )
+        self._moves, self._move_index = self.move_table(color)
+        self._attack_rays = self.attack_table(color)
 
-        self._pos = Position(x, y)
-        self._or_pos = Position(x, y)
+        self._alife = True
+        self._pos = None
+        self._or_pos = None
         self._moves_n = 0
+        self.reset(x, y, moved)
 
-        self._moves = None
-        self.init_moves()
+    def reset(self, x, y, moved=False):
+        """Put piece back in game at (x, y), as if it had never moved.
 
-        Piece.count += 1
-        self._id = Piece.count
-        Piece.pieces[color].append(self)
+        Args:
+            x, y (int): position of piece, also becoming its origin
+            moved (bool): whether piece must be considered as moved
+        """
+        self._alife = True
+        self._pos = Position.of(x, y)
+        self._or_pos = self._pos
+        self._moves_n = 1 if moved else 0
 
-    def init_moves(self):
+    @classmethod
+    def move_specs(cls, color):
+        """Return list of gameplay.moves.MoveSpec a piece can do.
+
+        Specs of a same direction must come by increasing steps.
+        """
         raise NotImplementedError
 
+    @classmethod
+    def move_table(cls, color):
+        """Return (move specs, {displacement tuple: move spec}).
+
+        Table is computed once per piece class and color.
+        """
+        key = (cls, color)
+        table = Piece.move_tables.get(key)
+        if table is None:
+            specs = tuple(cls.move_specs(color))
+            index = {}
+            for spec in specs:
+                index.setdefault(spec.vector.t, spec)
+            table = Piece.move_tables[key] = (specs, index)
+        return table
+
+    @classmethod
+    def attack_table(cls, color):
+        """Return, by square index, rays of squares attacked from it.
+
+        A ray lists (position, square index) of a direction by increasing
+        steps, up to board edge. Table is computed once per piece class and
+        color.
+        """
+        key = (cls, color)
+        table = Piece.attack_tables.get(key)
+        if table is None:
+            specs, _ = cls.move_table(color)
+            table = []
+            for square in range(64):
+                origin = Position.from_square(square)
+                rays = {}
+                for spec in specs:
+                    if not spec.kind.attacks:
+                        continue
+                    npos = origin + spec.vector
+                    if 0 <= npos.x < 8 and 0 <= npos.y < 8:
+                        rays.setdefault(spec.direction.t, []).append(
+                            (npos, npos.square)
+                        )
+                table.append(tuple(tuple(ray) for ray in rays.values()))
+            Piece.attack_tables[key] = table
+        return table
+
     @property
     def color(self):
         return self._color
@@ -59,11 +119,11 @@ class Piece(object):
     def set(self, npos):
         """Go not next position."""
         self._moves_n += 1
-        self._pos = Position(npos)
+        self._pos = npos if npos.__class__ is Position else Position(npos)
 
     def unset(self, opos):
         self._moves_n -= 1
-        self._pos = Position(opos)
+        self._pos = opos if opos.__class__ is Position else Position(opos)
 
     # Utils
 
@@ -80,14 +140,57 @@ class Piece(object):
 
     def get_move(self, move_tuple):
         """Return move if exists, raise InvalidMove if not."""
-        for move in self._moves:
-            if move == move_tuple:
-                return move
+        if isinstance(move_tuple, (list, tuple)):
+            spec = self._move_index.get(tuple(move_tuple))
+        else:
+            spec = self._move_index.get(move_tuple.t)
+        if spec is not None:
+            return spec.bind(self)
         raise InvalidMove(
             "%s %s can't do %s move."
             % (self.color_name(), self.__class__.__name__, move_tuple)
         )
 
+    def legal_moves(self, board):
+        """Return moves piece can do on board.
+
+        Moves of a direction are expected by increasing number of steps, so
+        that a direction is dropped as soon as it leaves the board or meets
+        a piece.
+        """
+        moves = []
+        blocked = set()
+        for spec in self._moves:
+            direction = spec.direction.t
+            if direction in blocked:
+                continue
+            npos = self._pos + spec.vector
+            if npos.x < 0 or npos.x > 7 or npos.y < 0 or npos.y > 7:
+                blocked.add(direction)
+                continue
+            move = spec.bind(self)
+            try:
+                move.check(board)
+            except InvalidMove:
+                pass
+            else:
+                if not board.exposes_king(move):
+                    moves.append(move)
+            if board.get(npos):
+                blocked.add(direction)
+        return moves
+
+    def attacked_squares(self, board):
+        """Return tuple of square indexes piece attacks on board."""
+        squares = []
+        get = board.get
+        for ray in self._attack_rays[self._pos.square]:
+            for npos, square in ray:
+                squares.append(square)
+                if get(npos):
+                    break
+        return tuple(squares)
+
     def has_moved(self):
         return self._moves_n > 0
 
@@ -4,11 +4,15 @@ from gameplay.moves import Move
 
 class Rook(Piece):
 
-    def init_moves(self):
-        self._moves = []
+    slider = True
+
+    @classmethod
+    def move_specs(cls, color):
+        specs = []
         for dpos in [(+1, 0), (0, -1), (0, +1), (-1, 0)]:
             for scal in range(1, 8):
-                self._moves.append(Move(self, dpos, steps=scal))
+                specs.append(Move.spec(dpos, steps=scal))
+        return specs
 
     def symbol(self):
         return "R"
@@ -1,5 +1,9 @@
+import argparse
+
 from gameplay import InvalidMove
-from board import Board
+from board import BitBoard
+from engine import Searcher
+from parameters import BLACK, WHITE
 
 
 class GameOver(Exception):
@@ -25,10 +29,16 @@ def read_position(position):
     try:
         x = 8 - int(position[1])
     except ValueError:
-        raise InvalidMove("Cant' read column %s" % position[1])
+        raise InvalidMove("Cant' read row %s" % position[1])
+    if not 0 <= x < 8:
+        raise InvalidMove("Cant' read row %s" % position[1])
     return x, y
 
 
+def write_position(x, y):
+    return "abcdefgh"[y] + str(8 - x)
+
+
 def read_input(message):
     r = message.split(" ")
     if len(r) != 2:
@@ -38,6 +48,15 @@ def read_input(message):
     return pos, npos
 
 
+def bot_move(board, searcher, time_limit):
+    """Return move chosen by searcher, None if there is none."""
+    result = searcher.search(board, time_limit=time_limit)
+    if result.move is None:
+        return None
+    pos, npos = result.move
+    return "%s %s" % (write_position(*pos), write_position(*npos))
+
+
 def play_move(move, board, f):
     pos, npos = read_input(move)
     board.move(pos, npos)
@@ -45,13 +64,26 @@ def play_move(move, board, f):
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--bot", choices=["white", "black"],
+        help="color played by computer",
+    )
+    parser.add_argument(
+        "--time", type=float, default=2.,
+        help="computer thinking time in seconds",
+    )
+    args = parser.parse_args()
+    bot_color = {"white": WHITE, "black": BLACK}.get(args.bot)
+    searcher = Searcher()
+
     print("++++ WELCOME TO CHESS ++++")
     print("\nHow to play:")
     print("\t- Specifiy your move such as 'a2 a4'")
 
     f = open("history.txt", "w+")
 
-    board = Board()
+    board = BitBoard()
 
     old_start = [
         "a2 a4",
@@ -81,6 +113,13 @@ if __name__ == '__main__':
         board.display()
         try:
             print("\n%s is playing:" % board.player)
+            if board.playing_color is bot_color:
+                move = bot_move(board, searcher, args.time)
+                if move is None:
+                    raise GameOver
+                print("\tMove:", move)
+                play_move(move, board, f)
+                continue
             move = input("\tMove:")
             if move in ["q", "quit", "s", "stop"]:
                 raise GameOver
@@ -0,0 +1,118 @@
+"""Replay move logs written by play.py to check them against rules.
+
+A log holds one move per line ('e2 e4'). Several games can be put in a
+single file, separated by empty lines. Lines starting with '#' are
+ignored.
+
+Usage:
+    python replay.py history.txt archive/*.txt
+"""
+import argparse
+import sys
+import time
+from collections import namedtuple
+
+from board import Board
+from gameplay import InvalidMove
+from play import read_input
+
+
+GameResult = namedtuple(
+    "GameResult",
+    [
+        "source",   # Path of log file
+        "index",    # Rank of game in log file
+        "plies",    # Number of moves successfully played
+        "move",     # Move that failed, None if game is valid
+        "error",    # Reason why move failed, None if game is valid
+    ]
+)
+
+
+def iter_games(paths):
+    """Yield (source, index, moves) for each game of log files.
+
+    Files are read line by line, only one game is held at a time.
+    """
+    for path in paths:
+        index = 0
+        moves = []
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("#"):
+                    continue
+                if line:
+                    moves.append(line)
+                elif moves:
+                    yield path, index, moves
+                    index += 1
+                    moves = []
+        if moves:
+            yield path, index, moves
+
+
+def replay_game(board, moves):
+    """Play moves on board.
+
+    Returns:
+        (int, str, str): number of moves played, failing move and error
+            (both None if every move is valid)
+    """
+    for plies, move in enumerate(moves):
+        try:
+            board.move(*read_input(move))
+        except InvalidMove as e:
+            return plies, move, str(e)
+    return len(moves), None, None
+
+
+def replay(games, board=None):
+    """Yield a GameResult for each (source, index, moves) game.
+
+    Args:
+        games (iterable): games, as given by iter_games
+        board (Board): board to reuse for every game
+    """
+    if board is None:
+        board = Board()
+    for source, index, moves in games:
+        board.reset()
+        yield GameResult(source, index, *replay_game(board, moves))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("paths", nargs="+", help="move log files")
+    parser.add_argument(
+        "-q", "--quiet", action="store_true",
+        help="only print summary",
+    )
+    args = parser.parse_args(args)
+
+    games = invalids = plies = 0
+    start = time.perf_counter()
+    for result in replay(iter_games(args.paths)):
+        games += 1
+        plies += result.plies
+        if result.error is not None:
+            invalids += 1
+            if not args.quiet:
+                print(
+                    "%s [game %s] move %s '%s': %s"
+                    % (
+                        result.source, result.index, result.plies + 1,
+                        result.move, result.error,
+                    )
+                )
+    elapsed = time.perf_counter() - start
+
+    print("Games: %s (%s invalid)" % (games, invalids))
+    print("Moves: %s" % plies)
+    print("Time: %.3fs" % elapsed)
+    print("Games/s: %.1f" % (games / elapsed if elapsed else 0))
+    return 1 if invalids else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""Line based TCP server hosting many chess games in one process.
+
+One command per line, each command gets one answer line, either
+'OK [result]' or 'ERR <reason>':
+    NEW                 create a game, answer its id
+    MOVE <id> <move>    play a move such as 'e2 e4'
+    UNDO <id>           undo last move
+    BOT <id>            let computer play, answer its move
+    FEN <id>            answer position as FEN
+    MOVES <id>          answer legal moves, comma separated
+    END <id>            end game
+    QUIT                close connection
+
+Board work runs in a thread pool and computer moves in a process pool, so
+that the event loop only deals with connections. Idle games are hibernated
+once boards in memory exceed a ceiling (see board.GameStore).
+
+Usage:
+    python server.py --port 8765
+"""
+import argparse
+import asyncio
+import inspect
+import itertools
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from board import BitBoard, GameStore
+from engine import Searcher
+from gameplay import InvalidMove
+from play import read_input, write_position
+
+
+class ProtocolError(Exception):
+    pass
+
+
+_searcher = None    # Searcher of a bot worker process
+
+
+def _bot_move(fen, time_limit):
+    """Return best move of position, in a bot worker process."""
+    global _searcher
+    if _searcher is None:
+        _searcher = Searcher()
+    board = BitBoard.from_fen(fen)
+    return _searcher.search(board, time_limit=time_limit).move
+
+
+def move_str(pos, npos):
+    """Return (pos, npos) move in play.read_input syntax."""
+    return "%s %s" % (write_position(*pos), write_position(*npos))
+
+
+class GameServer(object):
+
+    def __init__(self, workers=None, bot_processes=None, bot_time=1.,
+                 max_memory=64 * 2**20):
+        """Create server.
+
+        Args:
+            workers (int): threads running board work
+            bot_processes (int): processes computing computer moves
+            bot_time (float): computer thinking time in seconds
+            max_memory (int): ceiling of estimated memory of boards kept
+                in memory, in bytes
+        """
+        self._locks = {}    # id: lock, a game serves one command at a time
+        self._ids = itertools.count(1)
+        self._store = GameStore(max_memory)
+        self._executor = ThreadPoolExecutor(workers)
+        self._bot_executor = ProcessPoolExecutor(bot_processes)
+        self._bot_time = bot_time
+
+    def close(self):
+        """Stop executors."""
+        self._executor.shutdown()
+        self._bot_executor.shutdown()
+
+    async def _run(self, func, *args):
+        """Run func in thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    # ----------------------------------------------------------------------- #
+    # Connections
+
+    async def handle(self, reader, writer):
+        """Serve a connection."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    answer = await self.execute(line.decode().strip())
+                except (ProtocolError, InvalidMove) as e:
+                    answer = "ERR %s" % e
+                except Exception as e:
+                    # Keep connection open whatever went wrong
+                    answer = "ERR Internal error (%s)" % e.__class__.__name__
+                if answer is None:
+                    break
+                writer.write((answer + "\n").encode())
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def execute(self, line):
+        """Return answer to a command line, None to close connection.
+
+        It catch self.do_<command> method and call it with command
+        arguments.
+        """
+        command, _, args = line.partition(" ")
+        if command.upper() == "QUIT":
+            return None
+        method = getattr(self, "do_" + command.lower(), None)
+        if not command or method is None:
+            raise ProtocolError("Unknown command %r" % command)
+        args = args.split(" ", 1) if args else []
+        try:
+            inspect.signature(method).bind(*args)
+        except TypeError:
+            raise ProtocolError("Wrong arguments for %s" % command.upper())
+        result = await method(*args)
+        return "OK" if result is None else "OK %s" % result
+
+    @asynccontextmanager
+    async def _board(self, game_id):
+        """Provide board of a game, to one command at a time."""
+        try:
+            lock = self._locks[game_id]
+        except KeyError:
+            raise ProtocolError("Unknown game %s" % game_id)
+        async with lock:
+            if game_id not in self._locks:
+                raise ProtocolError("Unknown game %s" % game_id)
+            # Rehydrating and hibernating games replay or log moves
+            board = await self._run(self._store.checkout, game_id)
+            try:
+                yield board
+            finally:
+                await self._run(self._store.checkin, game_id)
+
+    # ----------------------------------------------------------------------- #
+    # Commands
+
+    async def do_new(self):
+        game_id = str(next(self._ids))
+        await self._run(self._store.create, game_id)
+        self._locks[game_id] = asyncio.Lock()
+        return game_id
+
+    async def do_move(self, game_id, move):
+        pos, npos = read_input(move)
+        async with self._board(game_id) as board:
+            await self._run(board.move, pos, npos)
+
+    async def do_undo(self, game_id):
+        async with self._board(game_id) as board:
+            if not board.ply:
+                raise ProtocolError("Nothing to undo")
+            await self._run(board.undo)
+
+    async def do_bot(self, game_id):
+        loop = asyncio.get_running_loop()
+        async with self._board(game_id) as board:
+            move = await loop.run_in_executor(
+                self._bot_executor, _bot_move, board.fen(), self._bot_time,
+            )
+            if move is None:
+                raise ProtocolError("No move to play")
+            await self._run(board.move, *move)
+        return move_str(*move)
+
+    async def do_fen(self, game_id):
+        async with self._board(game_id) as board:
+            return board.fen()
+
+    async def do_moves(self, game_id):
+        async with self._board(game_id) as board:
+            moves = await self._run(board.legal_moves)
+            return ",".join(
+                move_str(move.get_origin().t, move.get_destination().t)
+                for move in moves
+            )
+
+    async def do_end(self, game_id):
+        async with self._board(game_id):
+            del self._locks[game_id]
+        await self._run(self._store.discard, game_id)
+
+
+async def serve(host, port, **kwargs):
+    server = GameServer(**kwargs)
+    tcp_server = await asyncio.start_server(server.handle, host, port)
+    try:
+        async with tcp_server:
+            await tcp_server.serve_forever()
+    finally:
+        server.close()
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--bot-processes", type=int, default=None)
+    parser.add_argument("--bot-time", type=float, default=1.)
+    parser.add_argument(
+        "--max-memory", type=int, default=64,
+        help="memory ceiling of boards kept in memory, in MB",
+    )
+    args = parser.parse_args(args)
+    try:
+        asyncio.run(
+            serve(
+                args.host, args.port,
+                workers=args.workers,
+                bot_processes=args.bot_processes,
+                bot_time=args.bot_time,
+                max_memory=args.max_memory * 2**20,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
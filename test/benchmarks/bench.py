@@ -0,0 +1,166 @@
+"""Micro-benchmarks of core operations.
+
+Results are written as JSON, times being best seconds per call among
+repeats. Comparing them with a baseline (a previous output) flags
+benchmarks slower than baseline by more than a tolerance.
+
+Reference results are kept in test/benchmarks/baseline.json, along with
+the Python version and machine they were measured on. Changes to hot paths
+are compared with it, and it is refreshed in the same commit when a change
+is accepted, so that its history tracks performance over time.
+
+Usage:
+    python -m test.benchmarks.bench --baseline test/benchmarks/baseline.json
+    python -m test.benchmarks.bench --output test/benchmarks/baseline.json
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+from collections import OrderedDict
+
+from board import Board
+from board.render import Renderer
+from play import read_input
+from utils import Position, Vector
+
+
+# Opening played by play.py
+GAME_SCRIPT = [
+    "a2 a4", "b7 b5", "a4 b5", "c7 c6", "b5 c6", "b8 c6", "b1 c3",
+    "d8 a5", "g1 f3", "a5 c3", "g2 g4", "c8 a6", "f1 h3",
+]
+
+BENCHMARKS = OrderedDict()  # name: (function building timed callable, calls)
+
+
+def benchmark(number):
+    """Register a benchmark timed over number calls per repeat."""
+    def register(func):
+        BENCHMARKS[func.__name__] = (func, number)
+        return func
+    return register
+
+
+@benchmark(number=200)
+def board_init():
+    return Board
+
+
+@benchmark(number=50)
+def move_undo():
+    board = Board()
+    moves = [read_input(move) for move in GAME_SCRIPT]
+
+    def play():
+        for move in moves:
+            board.move(*move)
+        for _ in moves:
+            board.undo()
+    return play
+
+
+@benchmark(number=20000)
+def get_move():
+    piece = Board().get(Position.of(7, 1))     # Knight
+    vector = Vector.of(-2, 1)
+    return lambda: piece.get_move(vector)
+
+
+@benchmark(number=20000)
+def xyitem_arithmetic():
+    position = Position(3, 4)
+    vector = Vector(1, 2)
+
+    def compute():
+        (position + vector) - vector == position
+        vector * 2
+    return compute
+
+
+@benchmark(number=200)
+def board_str():
+    board = Board()
+    return board.board_str
+
+
+@benchmark(number=200)
+def render_miss():
+    # board_str caches renders per position, this times a cache miss
+    board = Board()
+    render = Renderer(cache_size=0).render
+    return lambda: render(board)
+
+
+def run(names=None, repeat=5, scale=1.):
+    """Return results of benchmarks.
+
+    Args:
+        names (list): benchmarks to run, all if None
+        repeat (int): number of timings of each benchmark
+        scale (float): factor applied to number of calls per timing
+    """
+    results = OrderedDict()
+    for name in names or BENCHMARKS:
+        build, number = BENCHMARKS[name]
+        number = max(1, int(number * scale))
+        timings = timeit.Timer(build()).repeat(repeat, number)
+        results[name] = {'number': number, 'time': min(timings) / number}
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def compare(results, baseline, tolerance=0.2):
+    """Return regressions of results against baseline.
+
+    Returns:
+        (list): (name, baseline time, time) of benchmarks slower than
+            baseline by more than tolerance (a ratio)
+    """
+    regressions = []
+    for name, result in results['results'].items():
+        reference = baseline['results'].get(name)
+        if reference and result['time'] > reference['time'] * (1 + tolerance):
+            regressions.append((name, reference['time'], result['time']))
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("names", nargs="*", help="benchmarks to run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.)
+    parser.add_argument("--output", help="file to write results to")
+    parser.add_argument("--baseline", help="results to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(args)
+
+    results = run(args.names, args.repeat, args.scale)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+            file.write("\n")
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, reference, time in regressions:
+            print(
+                "REGRESSION %s: %.3g s -> %.3g s (x%.2f)"
+                % (name, reference, time, time / reference),
+                file=sys.stderr,
+            )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,31 @@
+import json
+import os
+
+from test.benchmarks.bench import BENCHMARKS, compare, main, run
+
+
+def test_run():
+    results = run(repeat=1, scale=0.01)
+    assert list(results['results']) == list(BENCHMARKS)
+    for result in results['results'].values():
+        assert result['time'] > 0
+
+    slow = json.loads(json.dumps(results))
+    for result in slow['results'].values():
+        result['time'] *= 10
+    assert compare(results, slow) == []
+    assert len(compare(slow, results)) == len(BENCHMARKS)
+
+
+def test_main(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    args = ["board_str", "--repeat", "1", "--scale", "0.01"]
+    assert main(args + ["--output", path]) == 0
+    assert main(args + ["--baseline", path, "--tolerance", "100"]) == 0
+
+
+def test_baseline():
+    path = os.path.join(os.path.dirname(__file__), "baseline.json")
+    with open(path) as file:
+        baseline = json.load(file)
+    assert list(baseline['results']) == list(BENCHMARKS)
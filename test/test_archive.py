@@ -0,0 +1,46 @@
+import os
+
+import archive
+from archive import CRASHED, ArchiveStats, validate
+from replay import replay
+
+
+GAMES = [
+    ("log", index, moves)
+    for index, moves in enumerate(
+        [["e2 e4", "e7 e5"], ["d2 d4", "d7 d5", "d4 d5"], ["g1 f3"]] * 5
+    )
+]
+
+
+def _crashing_replay(games):
+    for _, index, _ in games:
+        if index == 7:
+            os._exit(1)
+    return list(replay(games))
+
+
+def test_validate():
+    results = list(validate(GAMES, processes=2, chunk_size=2))
+    assert [result.index for result in results] == list(range(15))
+    assert results == list(replay(GAMES))
+
+    stats = ArchiveStats()
+    for result in results:
+        stats.add(result)
+    assert stats.as_dict() == {
+        'games': 15,
+        'plies': 25,
+        'invalid': 5,
+        'crashed': 0,
+        'errors': {"Can't move on another piece with that move": 5},
+    }
+
+
+def test_validate_crash(monkeypatch):
+    monkeypatch.setattr(archive, "_replay_chunk", _crashing_replay)
+    results = list(validate(GAMES, processes=2, chunk_size=3))
+    assert [result.index for result in results] == list(range(15))
+    assert [result.error == CRASHED for result in results] == [
+        index == 7 for index in range(15)
+    ]
@@ -0,0 +1,10 @@
+from board.render import Renderer
+
+
+def render(board):
+    """Return board representation, bypassing cache of Board.board_str.
+
+    Renders are cached per position, so that comparing board_str of two
+    boards with a same Zobrist key would compare a string with itself.
+    """
+    return Renderer(cache_size=0).render(board)
@@ -0,0 +1,73 @@
+from board import BitBoard, Board
+from gameplay import InvalidMove
+from play import read_input
+from test.test_board import render
+
+import pytest
+
+
+MOVES = [
+    "a2 a4", "b7 b5", "a4 b5", "c7 c6", "b5 c6", "b8 c6", "b1 c3",
+    "d8 a5", "g1 f3", "a5 c3", "g2 g4", "c8 a6", "f1 h3",
+]
+
+
+def check_masks(board):
+    occupancy = 0
+    for color, pieces in board._pieces.items():
+        for piece in pieces:
+            bit = 1 << piece.pos.square
+            mask = board.mask(color, piece.symbol())
+            assert bool(mask & bit) is piece.is_alife()
+            if piece.is_alife():
+                occupancy |= bit
+    assert board.occupancy() == occupancy
+
+
+def test_BitBoard():
+    board = BitBoard()
+    ref = Board()
+    check_masks(board)
+    for move in MOVES:
+        board.move(*read_input(move))
+        ref.move(*read_input(move))
+        check_masks(board)
+        assert render(board) == render(ref)
+    for _ in MOVES:
+        board.undo()
+        check_masks(board)
+    assert render(board) == render(Board())
+
+
+def move_pairs(board):
+    return sorted(
+        (move.get_origin().t, move.get_destination().t)
+        for move in board.legal_moves()
+    )
+
+
+def test_BitBoard_generation():
+    board = BitBoard()
+    ref = Board()
+    for ply in range(40):
+        pairs = move_pairs(board)
+        assert pairs == move_pairs(ref)
+        assert board._attacks == ref._attacks
+        pos, npos = pairs[ply * 7 % len(pairs)]
+        board.move(pos, npos)
+        ref.move(pos, npos)
+    for _ in range(40):
+        board.undo()
+        ref.undo()
+        assert board._attacks == ref._attacks
+
+
+def test_BitBoard_path():
+    board = BitBoard()
+    with pytest.raises(InvalidMove):
+        board.move(*read_input("a1 a3"))
+    with pytest.raises(InvalidMove):
+        board.move(*read_input("c1 a3"))
+    board.move(*read_input("b2 b3"))
+    board.move(*read_input("a7 a6"))
+    board.move(*read_input("c1 a3"))
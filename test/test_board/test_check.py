@@ -0,0 +1,73 @@
+import pytest
+
+from board import Board
+from gameplay import InvalidMove
+from parameters import BLACK, WHITE
+from play import read_input
+from utils import Position
+
+
+def play(board, moves):
+    for move in moves:
+        board.move(*read_input(move))
+        check_attacks(board)
+
+
+def check_attacks(board):
+    """Check incremental attack maps against a full computation."""
+    for color in [BLACK, WHITE]:
+        counts = [0] * 64
+        for piece in board._pieces[color]:
+            if piece.is_alife():
+                for square in piece.attacked_squares(board):
+                    counts[square] += 1
+        assert board._attacks[color] == counts
+
+
+def test_attacks_incremental():
+    board = Board()
+    moves = [
+        "e2 e4", "d7 d5", "e4 d5", "d8 d5", "g1 f3", "c8 g4",
+        "f1 e2", "b8 c6", "e1 g1", "e8 c8",
+    ]
+    play(board, moves)
+    for _ in moves:
+        board.undo()
+        check_attacks(board)
+
+
+def test_check():
+    board = Board()
+    play(board, ["e2 e4", "f7 f6", "d2 d4", "g7 g5", "d1 h5"])
+    assert board.is_in_check()
+    assert board.is_in_check(BLACK)
+    assert not board.is_in_check(WHITE)
+    assert board.attackers(Position(0, 4)) != set()
+    assert board.legal_moves() == []
+    with pytest.raises(InvalidMove):
+        board.move(*read_input("a7 a6"))
+
+
+def test_pinned_piece():
+    board = Board()
+    play(board, ["e2 e4", "d7 d5", "f1 b5"])
+    assert board.is_in_check()
+    assert len(board.legal_moves()) == 5
+    play(board, ["b8 c6", "a2 a3"])
+    assert not board.is_in_check()
+    with pytest.raises(InvalidMove):
+        board.move(*read_input("c6 e5"))
+    board.move(*read_input("a7 a6"))
+
+
+def test_castling_check():
+    board = Board.from_fen("4k3/8/8/8/8/8/5r2/R3K2R w KQ - 0 1")
+    with pytest.raises(InvalidMove):
+        board.move(*read_input("e1 g1"))
+    board.move(*read_input("e1 c1"))
+
+    board = Board.from_fen("4k3/8/8/4r3/8/8/8/R3K2R w KQ - 0 1")
+    for move in ["e1 g1", "e1 c1", "a1 a2"]:
+        with pytest.raises(InvalidMove):
+            board.move(*read_input(move))
+    board.move(*read_input("e1 f1"))
@@ -0,0 +1,60 @@
+import pytest
+
+from board import BitBoard, Board, EncodingError
+from play import read_input
+
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+MOVES = [
+    "e2 e4", "d7 d5", "e4 d5", "d8 d5", "g1 f3", "c8 g4",
+    "f1 e2", "b8 c6", "e1 g1", "a7 a6",
+]
+
+
+def test_fen():
+    board = Board()
+    assert board.fen() == START_FEN
+    board.move(*read_input("e2 e4"))
+    assert board.fen() == (
+        "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+    )
+    for move in MOVES[1:]:
+        board.move(*read_input(move))
+        copy = BitBoard.from_fen(board.fen())
+        assert copy.fen() == board.fen()
+        assert copy.key == board.key
+    assert board.fen().split()[2:] == ["kq", "-", "0", "6"]
+
+
+def test_fen_errors():
+    for fen in [
+        "",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP w",
+        "rnbqkbnr/pppppppp/9/8/8/8/PPPPPPPP/RNBQKBNR w",
+        "rnbqkbnr/ppppxppp/8/8/8/8/PPPPPPPP/RNBQKBNR w",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR x",
+    ]:
+        with pytest.raises(EncodingError):
+            Board.from_fen(fen)
+
+
+def test_packed():
+    board = Board()
+    for move in MOVES:
+        board.move(*read_input(move))
+        data = board.pack()
+        assert len(data) == 33
+        copy = Board.from_packed(data)
+        assert copy.pack() == data
+        assert copy.fen().split()[:3] == board.fen().split()[:3]
+
+
+def test_decode_errors():
+    packed = Board().pack()
+    snapshot = Board().snapshot()
+    for data in [packed[:-1], packed + b"\0", b"\xf0" + packed[1:]]:
+        with pytest.raises(EncodingError):
+            Board.from_packed(data)
+    for data in [snapshot[:-1], b"\x0d" + snapshot[1:]]:
+        with pytest.raises(EncodingError):
+            Board.from_snapshot(data)
@@ -0,0 +1,48 @@
+import json
+
+from board import Board, instrumentation
+from gameplay import InvalidMove
+from play import read_input
+
+
+def test_instrumentation(tmp_path):
+    original_move = Board.move
+    board = Board()
+    instrumentation.reset()
+    instrumentation.enable()
+    try:
+        board.move(*read_input("e2 e4"))
+        for move in ["d8 d5", "a7 a3", "e7 e5", "e4 e6"]:
+            try:
+                board.move(*read_input(move))
+            except InvalidMove:
+                pass
+        board.undo()
+        board.undo()
+        board.board_str()
+        stats = Board.stats()
+        instrumentation.dump(str(tmp_path / "stats.json"))
+    finally:
+        instrumentation.disable()
+    assert Board.move is original_move
+
+    calls = stats['calls']
+    assert calls['Board.move']['count'] == 5
+    assert calls['Board.undo']['count'] == 2
+    assert calls['Board.board_str']['count'] == 1
+    assert calls['Move.check']['count'] == 3
+    # e4 e6 raises before calling Move.check
+    assert calls['FirstMove.check']['count'] == 3
+    assert calls['Piece.get_move']['count'] == 5
+    assert calls['Action.apply']['count'] == 2
+    assert stats['errors']['Board.move'] == {
+        "Bump into someone at (N, N)": 1,
+        "black Pawn can't do (N, N) move.": 1,
+        "Forbidden when piece has moved already": 1,
+    }
+    with open(str(tmp_path / "stats.json")) as file:
+        assert json.load(file) == stats
+
+    # Disabled instrumentation counts nothing
+    board.move(*read_input("e2 e4"))
+    assert Board.stats() == stats
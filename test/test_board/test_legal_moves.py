@@ -0,0 +1,53 @@
+import itertools
+
+from board import Board
+from gameplay import InvalidMove
+from play import read_input, read_position
+from utils import Position
+
+
+MOVES = [
+    "a2 a4", "b7 b5", "a4 b5", "c7 c6", "b5 c6", "b8 c6", "b1 c3",
+    "d8 a5", "g1 f3", "a5 c3", "g2 g4", "c8 a6", "f1 h3",
+]
+
+
+def brute_force(board):
+    """Return (origin, destination) pairs accepted by Board.move."""
+    pairs = set()
+    squares = list(itertools.product(range(8), range(8)))
+    for pos, npos in itertools.product(squares, squares):
+        try:
+            board.move(pos, npos)
+        except InvalidMove:
+            continue
+        board.undo()
+        pairs.add((pos, npos))
+    return pairs
+
+
+def as_pairs(moves):
+    return {
+        (move.get_origin().t, move.get_destination().t) for move in moves
+    }
+
+
+def test_legal_moves():
+    board = Board()
+    assert len(board.legal_moves()) == 20
+    for move in MOVES:
+        board.move(*read_input(move))
+        assert as_pairs(board.legal_moves()) == brute_force(board)
+
+
+def test_legal_moves_castling():
+    board = Board()
+    for move in ["e2 e4", "e7 e5", "g1 f3", "b8 c6", "f1 c4", "g8 f6"]:
+        board.move(*read_input(move))
+    moves = board.legal_moves()
+    castling = [move for move in moves if move.steps == 2
+                and move.piece.symbol() == "K"]
+    assert len(castling) == 1
+    board.play(castling[0])
+    assert board.get(Position(*read_position("g1"))).symbol() == "K"
+    assert board.get(Position(*read_position("f1"))).symbol() == "R"
@@ -0,0 +1,37 @@
+import random
+
+from board import BitBoard, Board
+from test.test_board import render
+
+
+def state(board):
+    return (
+        board.fen(), board.key, board.castling_rights(), board.ply,
+        [list(counts) for counts in board._attacks.values()],
+        render(board),
+    )
+
+
+def test_make_unmake():
+    rand = random.Random(0)
+    for board_class in [Board, BitBoard]:
+        board, ref = board_class(), board_class()
+        states = [state(board)]
+        for _ in range(40):
+            moves = board.legal_moves()
+            if not moves:
+                break
+            # Prefer castling and captures, to go through every path
+            special = [
+                move for move in moves
+                if move.castling or board.get(move.get_destination())
+            ]
+            move = rand.choice(special or moves)
+            ref.move(move.get_origin().t, move.get_destination().t)
+            board.make(move)
+            assert state(board) == state(ref)
+            states.append(state(board))
+        while len(states) > 1:
+            states.pop()
+            board.unmake()
+            assert state(board) == states[-1]
@@ -0,0 +1,55 @@
+from board import BitBoard, Board, BoardPool
+from parameters import BLACK, WHITE
+from pieces import King, Rook
+from pieces.piece import Piece
+from play import read_input
+from test.test_board import render
+
+
+MOVES = ["e2 e4", "d7 d5", "e4 d5", "d8 d5", "e1 e2"]
+
+
+def test_reset():
+    for board_class in [Board, BitBoard]:
+        board = board_class()
+        pieces = {id(piece) for piece in board._pieces[WHITE]}
+        for move in MOVES:
+            board.move(*read_input(move))
+        board.reset()
+        fresh = board_class()
+        assert render(board) == render(fresh)
+        assert board.key == fresh.key
+        assert board.legal_moves() != []
+        assert {id(piece) for piece in board._pieces[WHITE]} == pieces
+        assert not hasattr(Piece, "pieces")
+
+
+def test_reset_placement():
+    board = Board()
+    board.reset(
+        [
+            (King, WHITE, 7, 4, False),
+            (Rook, WHITE, 7, 7, False),
+            (King, BLACK, 0, 4, True),
+        ],
+        playing_color=BLACK,
+    )
+    assert board.player == "Black"
+    assert board.castling_rights() == 0b1000
+    assert len(board._pieces[WHITE]) == 2
+    assert len(board.legal_moves()) == 5
+
+
+def test_BoardPool():
+    pool = BoardPool(size=2, max_size=2)
+    assert len(pool) == 2
+    with pool.game() as board:
+        assert len(pool) == 1
+        board.move(*read_input("e2 e4"))
+    assert len(pool) == 2
+    assert board.ply == 0
+    board2 = pool.acquire()
+    assert render(board2) == render(Board())
+    pool.release(board2)
+    pool.release(Board())
+    assert len(pool) == 2
@@ -0,0 +1,66 @@
+import pytest
+
+from board import Board
+from board.render import BOARD_FORMAT, Renderer
+from play import read_input
+
+
+def replace_render(board):
+    """Render board by replacing squares of format one by one."""
+    render = BOARD_FORMAT
+    for x in range(8):
+        for y in range(8):
+            piece = board._board[x][y]
+            empty = " - " if (x + y) % 2 else "   "
+            render = render.replace(
+                "%s %s" % (x, y),
+                piece.repr() if piece and piece.is_alife() else empty,
+            )
+    return render
+
+
+def test_Renderer():
+    board = Board()
+    renderer = Renderer(cache_size=2)
+    assert renderer.render(board) == replace_render(board)
+
+    for move in ["e2 e4", "d7 d5", "e4 d5"]:
+        board.move(*read_input(move))
+        assert renderer.render(board) == replace_render(board)
+        assert board.board_str() == replace_render(board)
+
+    # Renders are cached per position
+    board.undo()
+    render = renderer.render(board)
+    assert render == replace_render(board)
+    assert renderer.render(board) is render
+    assert len(renderer._cache) == 2
+
+
+def test_Renderer_diff():
+    board = Board()
+    renderer = Renderer()
+    assert len(renderer.diff(board)) == 64
+    for move in ["e2 e4", "d7 d5", "e4 d5"]:
+        board.move(*read_input(move))
+    assert renderer.diff(board) == [
+        (1, 3, "   "), (3, 3, "wPw"), (4, 4, "   "), (6, 4, "   "),
+    ]
+    assert renderer.diff(board) == []
+
+    # Undone moves are part of diff
+    board.undo()
+    board.move(*read_input("b1 c3"))
+    assert renderer.diff(board) == [
+        (3, 3, "bPb"), (4, 4, "wPw"), (5, 2, "wNw"), (7, 1, "   "),
+    ]
+
+    board.reset()
+    assert len(renderer.diff(board)) == 64
+    assert len(renderer.diff(Board())) == 64
+
+    # Moves made for search are not followed
+    board.make(board.legal_moves()[0])
+    with pytest.raises(AssertionError):
+        renderer.diff(board)
+    board.unmake()
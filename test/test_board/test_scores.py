@@ -0,0 +1,38 @@
+from board import Board
+from parameters import BLACK, WHITE
+from play import read_input
+
+
+def check_scores(board):
+    for color in [BLACK, WHITE]:
+        assert board.score(color) == board.compute_score(color)
+
+
+def test_scores_incremental():
+    board = Board()
+    assert board.evaluate() == 0
+    moves = [
+        "e2 e4", "d7 d5", "e4 d5", "d8 d5", "g1 f3", "c8 g4",
+        "f1 e2", "b8 c6", "e1 g1", "e8 c8",
+    ]
+    for move in moves:
+        board.move(*read_input(move))
+        check_scores(board)
+    for move in board.legal_moves():
+        board.make(move)
+        check_scores(board)
+        board.unmake()
+    for _ in moves:
+        board.undo()
+        check_scores(board)
+    assert board.evaluate() == 0
+
+
+def test_evaluate():
+    board = Board()
+    board.move(*read_input("e2 e4"))
+    # Black to play, white pawn in center
+    assert board.evaluate() < 0
+    board.move(*read_input("d7 d5"))
+    board.move(*read_input("e4 d5"))
+    assert board.evaluate() < -50
@@ -0,0 +1,40 @@
+import pytest
+
+from board import BitBoard, Board
+from gameplay import InvalidMove
+from play import read_input
+from test.test_board import render
+
+
+MOVES = [
+    "e2 e4", "d7 d5", "e4 d5", "d8 d5", "g1 f3", "c8 g4",
+    "f1 e2", "b8 c6", "e1 g1", "a7 a6",
+]
+
+
+def test_snapshot():
+    board = Board()
+    assert len(board.snapshot()) == 67
+    snapshots = [board.snapshot()]
+    for move in MOVES:
+        board.move(*read_input(move))
+        snapshots.append(board.snapshot())
+
+    for ply, snapshot in enumerate(snapshots):
+        copy = Board.from_snapshot(snapshot)
+        assert copy.snapshot() == snapshot
+        assert copy.ply == ply
+
+    copy = BitBoard.from_snapshot(snapshots[-1])
+    assert render(copy) == render(board)
+    assert copy.key == board.key
+    assert copy.castling_rights() == board.castling_rights() == 0b0011
+    assert len(copy.legal_moves()) == len(board.legal_moves())
+
+    board.load_snapshot(snapshots[2])
+    assert board.player == "White"
+    assert board.key == Board.from_snapshot(snapshots[2]).key
+    # Pawns off their start row can't double step anymore
+    with pytest.raises(InvalidMove):
+        board.move(*read_input("e4 e6"))
+    board.move(*read_input("c2 c4"))
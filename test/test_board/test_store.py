@@ -0,0 +1,90 @@
+import pytest
+
+from board import GameStore
+from board.board import BoardError
+from board.store import BOARD_MEMORY, PLY_MEMORY
+from play import read_input
+
+
+def play(board, *moves):
+    for move in moves:
+        board.move(*read_input(move))
+
+
+def test_GameStore():
+    store = GameStore(max_memory=2 * BOARD_MEMORY + 10000)
+    store.create("a")
+    with store.use("a") as board:
+        play(board, "e2 e4", "e7 e5", "g1 f3", "b8 c6")
+    store.create("b")
+    with store.use("b") as board:
+        play(board, "d2 d4")
+    assert store.resident() == 2
+    assert store.memory() == 2 * BOARD_MEMORY + 5 * PLY_MEMORY
+
+    # Least recently used game is hibernated
+    store.create("c")
+    assert store.resident() == 2
+    assert len(store) == 3
+    assert "a" in store
+
+    with store.use("a") as board:
+        assert board.ply == 4
+        assert board.move_log().tolist() == [
+            52 << 6 | 36, 12 << 6 | 28, 62 << 6 | 45, 1 << 6 | 18,
+        ]
+        board.undo()
+        assert board.fen().startswith("rnbqkbnr")
+    assert store.resident() == 2
+
+    # Games in use are not hibernated
+    with store.use("b"), store.use("c"):
+        with store.use("a"):
+            assert store.resident() == 3
+        assert store.resident() == 2
+
+    store.hibernate("b")
+    store.discard("b")
+    assert "b" not in store
+    with pytest.raises(KeyError):
+        with store.use("b"):
+            pass
+
+
+def test_GameStore_tight():
+    store = GameStore(max_memory=BOARD_MEMORY + 10)
+    store.create("a")
+    store.create("b")
+    with store.use("a") as board_a:
+        play(board_a, "e2 e4")
+    store.create("c")
+    with store.use("c") as board_c:
+        assert board_c.ply == 0
+    with store.use("a") as board:
+        assert board.move_log().tolist() == [52 << 6 | 36]
+    assert store.memory() <= BOARD_MEMORY + PLY_MEMORY
+
+
+def test_GameStore_rehydration():
+    store = GameStore(max_memory=0)
+    store.create("a")
+    with store.use("a") as board:
+        play(board, "e2 e4")
+    assert store.resident() == 0
+
+    # Id of a game being rehydrated (as in checkout) is still taken
+    hibernated = store._hibernated.pop("a")
+    store._in_use.add("a")
+    with pytest.raises(KeyError):
+        store.create("a")
+    store._in_use.discard("a")
+    store._hibernated["a"] = hibernated
+
+    # Board of a failed rehydration goes back to pool
+    base, moves, snapshot = store._hibernated["a"]
+    store._hibernated["a"] = store._hibernated["a"]._replace(snapshot=base)
+    pooled = len(store._pool)
+    with pytest.raises(BoardError):
+        store.checkout("a")
+    assert len(store._pool) == pooled
+    assert "a" in store
@@ -0,0 +1,34 @@
+from board import Board
+from play import read_input
+
+
+def test_validate_moves():
+    board = Board()
+    for move in ["e2 e4", "d7 d5", "f1 b5"]:
+        board.move(*read_input(move))
+    fen = board.fen()
+    pairs = [
+        read_input("c7 c6"),
+        read_input("a7 a6"),
+        read_input("e4 e5"),
+        read_input("e6 e5"),
+        read_input("b8 b6"),
+        read_input("d8 d2"),
+        ((1, 0), (8, 0)),
+        [[1, 2], [2, 2]],
+    ]
+    verdicts = board.validate_moves(pairs)
+    assert board.fen() == fen
+    assert [verdict.valid for verdict in verdicts] == [
+        True, False, False, False, False, False, False, True,
+    ]
+    assert [verdict.reason for verdict in verdicts] == [
+        None,
+        "Can't leave your king in check",
+        "You must move piece of your color",
+        "No piece on that position",
+        "black Knight can't do (2, 0) move.",
+        "Bump into someone at (3, 3)",
+        "Position out of board",
+        None,
+    ]
@@ -0,0 +1,39 @@
+from board import Board
+from play import read_input
+
+
+def play(board, moves):
+    for move in moves:
+        board.move(*read_input(move))
+        assert board.key == board.compute_key()
+
+
+def test_key_incremental():
+    board = Board()
+    start = board.key
+    moves = [
+        "e2 e4", "d7 d5", "e4 d5", "d8 d5", "g1 f3", "c8 g4",
+        "f1 e2", "b8 c6", "e1 g1", "e8 c8",
+    ]
+    play(board, moves)
+    assert board.castling_rights() == 0
+    for _ in moves:
+        board.undo()
+        assert board.key == board.compute_key()
+    assert board.key == start
+    assert board.castling_rights() == 0b1111
+
+
+def test_key_transposition():
+    board1, board2 = Board(), Board()
+    play(board1, ["g1 f3", "g8 f6", "b1 c3"])
+    play(board2, ["b1 c3", "g8 f6", "g1 f3"])
+    assert board1.key == board2.key
+
+
+def test_key_castling_rights():
+    board1, board2 = Board(), Board()
+    play(board1, ["h2 h4", "h7 h5", "g1 f3", "a7 a6", "f3 g1", "a6 a5"])
+    play(board2, ["h2 h4", "h7 h5", "h1 h2", "a7 a6", "h2 h1", "a6 a5"])
+    assert board1.board_str() == board2.board_str()
+    assert board1.key != board2.key
@@ -0,0 +1,36 @@
+import numpy as np
+
+from board import Board
+from engine import batch
+from parameters import BLACK, WHITE
+from play import read_input
+
+
+def boards():
+    board = Board()
+    positions = [Board.from_snapshot(board.snapshot())]
+    for move in ["e2 e4", "d7 d5", "e4 d5", "d8 d5", "b1 c3", "d5 a2"]:
+        board.move(*read_input(move))
+        positions.append(Board.from_snapshot(board.snapshot()))
+    return positions
+
+
+def test_batch():
+    positions = boards()
+    codes = batch.to_array(positions)
+    assert codes.shape == (7, 64)
+    snapshots = [board.snapshot() for board in positions]
+    assert (batch.to_array(snapshots) == codes).all()
+    colors = batch.to_colors(snapshots)
+    assert (colors == batch.to_colors(positions)).all()
+
+    assert batch.to_planes(codes).shape == (7, 12, 64)
+    assert batch.piece_counts(codes)[0].tolist() == [8, 2, 2, 2, 1, 1] * 2
+
+    material = batch.material(codes)
+    assert material[0][BLACK] == material[0][WHITE] == 4000
+    assert material[-1][BLACK] == 3900
+    assert material[-1][WHITE] == 3800
+
+    evaluations = batch.evaluate(codes, colors)
+    assert evaluations.tolist() == [board.evaluate() for board in positions]
@@ -0,0 +1,21 @@
+from board import Board
+from engine import ParallelSearcher, Searcher
+from engine.search import MATE
+
+
+def test_ParallelSearcher():
+    board = Board.from_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    with ParallelSearcher(processes=2, table_mb=1) as searcher:
+        result = searcher.search(board, max_depth=3)
+        assert result.move == ((7, 0), (0, 0))
+        assert result.score == MATE - 1
+        assert result.pv == [result.move]
+
+        board = Board.from_fen("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1")
+        result = searcher.search(board, max_depth=2)
+        expected = Searcher().search(board, max_depth=2)
+        assert result.move == expected.move
+        assert result.score == expected.score
+
+        result = searcher.search(Board(), time_limit=0.5)
+        assert result.move is not None
@@ -0,0 +1,51 @@
+import itertools
+import time
+
+from board import Board
+from engine import Searcher, search
+from engine.search import MATE
+
+
+def test_search_mate_in_one():
+    board = Board.from_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    result = Searcher().search(board, max_depth=3)
+    assert result.move == ((7, 0), (0, 0))
+    assert result.score == MATE - 1
+    assert result.pv == [result.move]
+    assert board.fen() == "6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1"
+
+
+def test_search_capture():
+    # Black queen hangs
+    board = Board.from_fen("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1")
+    result = Searcher().search(board, max_depth=2)
+    assert result.move == ((6, 3), (3, 3))
+    assert result.score > 0
+    assert len(result.pv) == 2
+
+
+def test_search_budget():
+    board = Board()
+    fen = board.fen()
+    searcher = Searcher()
+    result = searcher.search(board, node_limit=300)
+    assert result.move is not None
+    assert searcher.nodes <= 300
+    assert board.fen() == fen
+
+    start = time.perf_counter()
+    result = searcher.search(board, time_limit=0.2)
+    assert result.move is not None
+    assert time.perf_counter() - start < 2
+    assert board.fen() == fen
+
+
+def test_search_clock(monkeypatch):
+    # Fake clock moving by 1 ms each time it is read
+    ticks = itertools.count()
+    monkeypatch.setattr(
+        search.time, "perf_counter", lambda: next(ticks) / 1000
+    )
+    searcher = Searcher()
+    searcher.search(Board(), time_limit=0.05)
+    assert searcher.nodes <= 50
@@ -0,0 +1,40 @@
+from engine import EXACT, LOWER, UPPER, TranspositionTable
+
+
+def test_TranspositionTable():
+    table = TranspositionTable(size_mb=1)
+    assert table.size <= 1 << 20
+    assert table.probe(12345) is None
+
+    table.store(12345, depth=4, score=-150, flag=LOWER, move=4095)
+    entry = table.probe(12345)
+    assert entry == (4, -150, LOWER, 4095)
+
+    # Move is kept when none is given
+    table.store(12345, depth=5, score=30, flag=EXACT)
+    assert table.probe(12345) == (5, 30, EXACT, 4095)
+
+
+def test_TranspositionTable_replacement():
+    table = TranspositionTable(size_mb=1)
+    buckets = len(table) // 2
+    key1, key2, key3 = 7, 7 + buckets, 7 + 2 * buckets
+
+    table.store(key1, depth=6, score=1, flag=EXACT)
+    table.store(key2, depth=2, score=2, flag=UPPER)
+    assert table.probe(key1).score == 1
+    assert table.probe(key2).score == 2
+
+    # Shallow entries go to always-replace slot
+    table.store(key3, depth=1, score=3, flag=EXACT)
+    assert table.probe(key1).score == 1
+    assert table.probe(key2) is None
+    assert table.probe(key3).score == 3
+
+    # Deeper entries take depth-preferred slot
+    table.store(key2, depth=8, score=4, flag=EXACT, move=0)
+    assert table.probe(key1) is None
+    assert table.probe(key2) == (8, 4, EXACT, 0)
+
+    table.clear()
+    assert table.usage() == 0
@@ -0,0 +1,15 @@
+from board import BitBoard, Board
+from perft import REFERENCE_COUNTS, divide, perft
+
+
+def test_perft():
+    for depth in [1, 2, 3]:
+        assert perft(Board(), depth) == REFERENCE_COUNTS[depth]
+    assert perft(BitBoard(), 2) == REFERENCE_COUNTS[2]
+
+
+def test_divide():
+    counts = divide(Board(), 2)
+    assert len(counts) == 20
+    assert counts["e2 e4"] == 20
+    assert sum(counts.values()) == REFERENCE_COUNTS[2]
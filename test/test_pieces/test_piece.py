@@ -0,0 +1,31 @@
+import pytest
+
+from gameplay import InvalidMove
+from parameters import BLACK, WHITE
+from pieces import King, Pawn, Queen
+from utils import Vector
+
+
+def test_get_move():
+    queen = Queen(4, 4, WHITE)
+    for spec in queen._moves:
+        assert queen.get_move(spec.vector).vector == spec.vector
+        assert queen.get_move(spec.vector.t).piece is queen
+    with pytest.raises(InvalidMove):
+        queen.get_move(Vector(1, 2))
+
+    white_pawn, black_pawn = Pawn(6, 0, WHITE), Pawn(1, 0, BLACK)
+    assert white_pawn.get_move((-2, 0)).steps == 2
+    assert black_pawn.get_move([2, 0]).steps == 2
+    with pytest.raises(InvalidMove):
+        white_pawn.get_move((2, 0))
+
+    king = King(7, 4, WHITE)
+    assert king.get_move((0, 2)).__class__.__name__ == "RCastling"
+    assert king.get_move((0, 1)).steps == 1
+
+
+def test_move_table_shared():
+    queen1, queen2 = Queen(0, 3, BLACK), Queen(7, 3, BLACK)
+    assert queen1._moves is queen2._moves
+    assert Pawn(1, 0, BLACK)._moves is not Pawn(6, 0, WHITE)._moves
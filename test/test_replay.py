@@ -0,0 +1,34 @@
+from replay import iter_games, replay
+
+
+LOG = """\
+# First game
+e2 e4
+e7 e5
+
+d2 d4
+d7 d5
+d4 d5
+
+
+g1 f3
+"""
+
+
+def test_iter_games(tmp_path):
+    path = tmp_path / "games.txt"
+    path.write_text(LOG)
+    assert list(iter_games([str(path)])) == [
+        (str(path), 0, ["e2 e4", "e7 e5"]),
+        (str(path), 1, ["d2 d4", "d7 d5", "d4 d5"]),
+        (str(path), 2, ["g1 f3"]),
+    ]
+
+
+def test_replay(tmp_path):
+    path = tmp_path / "games.txt"
+    path.write_text(LOG)
+    results = list(replay(iter_games([str(path)])))
+    assert [result.plies for result in results] == [2, 2, 1]
+    assert [result.move for result in results] == [None, "d4 d5", None]
+    assert results[1].error is not None
@@ -0,0 +1,81 @@
+import asyncio
+
+from server import GameServer
+
+
+async def session(server, lines):
+    tcp_server = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+    port = tcp_server.sockets[0].getsockname()[1]
+    async with tcp_server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        answers = []
+        for line in lines:
+            writer.write((line + "\n").encode())
+            await writer.drain()
+            answers.append((await reader.readline()).decode().rstrip())
+        writer.close()
+    return answers
+
+
+def test_GameServer():
+    server = GameServer(workers=2, bot_processes=1, bot_time=0.1)
+    try:
+        answers = asyncio.run(session(server, [
+            "NEW",
+            "MOVE 1 e2 e4",
+            "MOVE 1 e2 e4",
+            "FEN 1",
+            "BOT 1",
+            "UNDO 1",
+            "MOVES 1",
+            "NEW",
+            "MOVE 2 a2 a9",
+            "END 1",
+            "FEN 1",
+            "DANCE",
+            "UNDO",
+            "MOVE 2",
+            "MOVE 2 a0 a1",
+            "MOVE 2 a9 a1",
+            "FEN 2",
+        ]))
+    finally:
+        server.close()
+
+    assert answers[0] == "OK 1"
+    assert answers[1] == "OK"
+    assert answers[2] == "ERR No piece on that position"
+    assert answers[3] == (
+        "OK rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+    )
+    assert answers[4].startswith("OK ")
+    assert answers[5] == "OK"
+    assert len(answers[6].split(",")) == 20
+    assert answers[7] == "OK 2"
+    assert answers[8].startswith("ERR ")
+    assert answers[9] == "OK"
+    assert answers[10] == "ERR Unknown game 1"
+    assert answers[11] == "ERR Unknown command 'DANCE'"
+    assert answers[12] == "ERR Wrong arguments for UNDO"
+    assert answers[13] == "ERR Wrong arguments for MOVE"
+    assert answers[14] == "ERR Cant' read row 0"
+    assert answers[15] == "ERR Cant' read row 9"
+    assert answers[16].startswith("OK ")
+
+
+def test_GameServer_hibernation():
+    server = GameServer(workers=1, bot_processes=1, max_memory=0)
+    try:
+        answers = asyncio.run(session(server, [
+            "NEW",
+            "MOVE 1 e2 e4",
+            "MOVE 1 e7 e5",
+            "UNDO 1",
+            "FEN 1",
+        ]))
+    finally:
+        server.close()
+    assert answers[:4] == ["OK 1", "OK", "OK", "OK"]
+    assert answers[4] == (
+        "OK rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+    )
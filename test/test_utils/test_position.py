@@ -0,0 +1,27 @@
+from utils.position import Position
+from utils.vector import Vector
+
+
+def test_Position_interned():
+    position = Position(3, 4)
+    assert Position.of(3, 4) is Position.from_square(28)
+    assert Position.of(3, 4) == position
+    assert position + Vector(1, -1) is Position.of(4, 3)
+    assert position - Position(1, 1) is Vector.of(2, 3)
+    assert Position.of(3, 8) == (3, 8)
+    assert position.square == 28
+
+
+def test_XYItem_hash():
+    squares = {Position(0, 1): "b8"}
+    assert squares[Position.of(0, 1)] == "b8"
+    assert squares[(0, 1)] == "b8"
+    assert Vector(1, 2) * 2 is Vector.of(2, 4)
+    assert not hasattr(Position(0, 0), "__dict__")
+
+
+def test_Position_immutable():
+    position = Position.of(3, 4)
+    assert not hasattr(position, "set")
+    assert position.copy() is position
+    assert Position.of(3, 4) == (3, 4)
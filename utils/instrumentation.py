@@ -0,0 +1,104 @@
+import json
+import re
+import threading
+import time
+from collections import Counter
+from functools import wraps
+
+
+def normalize_reason(message):
+    """Return error message with its numbers replaced, to group errors."""
+    return re.sub(r"-?\d+", "N", message)
+
+
+class Registry(object):
+    """Call counts and cumulative timings of instrumented methods.
+
+    Methods are replaced by timed wrappers on enable and restored on
+    disable, so that instrumentation costs nothing when disabled.
+    Timings are inclusive: time of a method includes time of instrumented
+    methods it calls.
+    """
+
+    def __init__(self):
+        self._originals = []    # (class, method name, original attribute)
+        self._calls = Counter()     # label: number of calls
+        self._times = Counter()     # label: cumulative time in seconds
+        self._errors = Counter()    # (label, reason): number of errors
+        self._lock = threading.Lock()   # Methods may run in threads
+
+    @property
+    def enabled(self):
+        return bool(self._originals)
+
+    def reset(self):
+        """Clear counters."""
+        with self._lock:
+            self._calls.clear()
+            self._times.clear()
+            self._errors.clear()
+
+    def enable(self, targets):
+        """Instrument methods.
+
+        Args:
+            targets (list): (class, method name, errors) tuples, where
+                errors is a tuple of exception classes to count per reason
+        """
+        for cls, name, errors in targets:
+            original = cls.__dict__[name]
+            self._originals.append((cls, name, original))
+            setattr(cls, name, self._wrap(
+                original, "%s.%s" % (cls.__name__, name), errors
+            ))
+
+    def disable(self):
+        """Restore instrumented methods."""
+        while self._originals:
+            cls, name, original = self._originals.pop()
+            setattr(cls, name, original)
+
+    def _wrap(self, func, label, errors):
+        calls, times, error_counts = self._calls, self._times, self._errors
+        lock = self._lock
+        clock = time.perf_counter
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            except errors as e:
+                with lock:
+                    error_counts[label, normalize_reason(str(e))] += 1
+                raise
+            finally:
+                elapsed = clock() - start
+                with lock:
+                    calls[label] += 1
+                    times[label] += elapsed
+        return wrapper
+
+    def stats(self):
+        """Return counters as a JSON serializable dict."""
+        with self._lock:
+            calls = dict(self._calls)
+            times = dict(self._times)
+            error_counts = dict(self._errors)
+        errors = {}
+        for (label, reason), count in sorted(error_counts.items()):
+            errors.setdefault(label, {})[reason] = count
+        return {
+            'calls': {
+                label: {'count': count, 'time': times[label]}
+                for label, count in sorted(calls.items())
+            },
+            'errors': errors,
+        }
+
+    def dump(self, fp):
+        """Write counters as JSON to a file object."""
+        json.dump(self.stats(), fp, indent=2, sort_keys=True)
+
+
+REGISTRY = Registry()
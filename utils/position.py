@@ -3,8 +3,35 @@ from .xyitem import XYItem
 
 
 class Position(XYItem):
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, x, y):
+        """Return position, shared instance for squares of board."""
+        if 0 <= x < 8 and 0 <= y < 8 and cls is Position:
+            return _SQUARES[x * 8 + y]
+        return super().of(x, y)
+
+    @property
+    def square(self):
+        """Return square index (0..63) of position."""
+        return self.x * 8 + self.y
+
+    @classmethod
+    def from_square(cls, square):
+        """Return position of square index."""
+        return _SQUARES[square]
+
     def __sub__(self, other):
         if isinstance(other, Position):
-            return Vector(self.x - other.x, self.y - other.y)
+            return Vector.of(self.x - other.x, self.y - other.y)
         else:
             return super().__sub__(other)
+
+
+_SQUARES = [
+    Position(x, y)
+    for x in range(8)
+    for y in range(8)
+]
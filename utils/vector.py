@@ -3,8 +3,24 @@ from .xyitem import XYItem
 
 class Vector(XYItem):
 
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, x, y):
+        """Return vector, shared instance for displacements within board."""
+        if -7 <= x <= 7 and -7 <= y <= 7 and cls is Vector:
+            return _DISPLACEMENTS[(x + 7) * 15 + y + 7]
+        return super().of(x, y)
+
     def iter(self, position, steps):
         int_pos = position
         for step in range(steps):
             int_pos = int_pos + self
             yield int_pos
+
+
+_DISPLACEMENTS = [
+    Vector(x, y)
+    for x in range(-7, 8)
+    for y in range(-7, 8)
+]
@@ -2,23 +2,15 @@ import itertools
 
 
 class XYItem(object):
+    """A (x, y) pair.
 
-    def __init__(self, x_or_xy, y=None):
-        self.x = None
-        self.y = None
-        self.set(x_or_xy, y)
+    Items are used as values: once created they are never modified, which
+    let subclasses hand out shared (interned) instances.
+    """
 
-    @property
-    def t(self):
-        """Return x, y tuple."""
-        return (self.x, self.y)
+    __slots__ = ("x", "y")
 
-    def copy(self):
-        """Return a copy."""
-        return self.__class__(self.x, self.y)
-
-    def set(self, x_or_xy, y=None):
-        """Set x, y."""
+    def __init__(self, x_or_xy, y=None):
         if isinstance(x_or_xy, XYItem):
             self.x = x_or_xy.x
             self.y = x_or_xy.y
@@ -31,19 +23,41 @@ class XYItem(object):
             self.x = x_or_xy
             self.y = y
 
+    @classmethod
+    def of(cls, x, y):
+        """Return item for x, y numbers, without any argument parsing."""
+        item = object.__new__(cls)
+        item.x = x
+        item.y = y
+        return item
+
+    @property
+    def t(self):
+        """Return x, y tuple."""
+        return (self.x, self.y)
+
+    def copy(self):
+        """Return item itself, items being immutable."""
+        return self
+
     def __add__(self, other):
-        return self.__class__(self.x + other.x, self.y + other.y)
+        return self.of(self.x + other.x, self.y + other.y)
 
     def __eq__(self, other):
         if isinstance(other, XYItem):
-            return self.t == other.t
+            return self.x == other.x and self.y == other.y
         elif isinstance(other, (list, tuple)):
             return self.t == tuple(other)
 
+    def __hash__(self):
+        return hash((self.x, self.y))
+
     def __mul__(self, other):
-        if isinstance(other, (int, float)):
+        if isinstance(other, int):
+            return self.of(other*self.x, other*self.y)
+        elif isinstance(other, float):
             return self.__class__(other*self.x, other*self.y)
-        return self.__class__(self.x*other.x, self.y*other.y)
+        return self.of(self.x*other.x, self.y*other.y)
 
     def __rmul__(self, other):
         return self * other
@@ -52,7 +66,7 @@ class XYItem(object):
         return self.__class__.__name__ + str(self)
 
     def __sub__(self, other):
-        return self.__class__(self.x - other.x, self.y - other.y)
+        return self.of(self.x - other.x, self.y - other.y)
 
     def __str__(self):
         return str(self.t)